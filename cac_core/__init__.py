@@ -3,9 +3,26 @@ CAC Core - foundational library for building CLI applications.
 
 Provides configuration management, credential storage, data modeling,
 output formatting, update checking, and an abstract command framework.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so a CLI
+only pays the import cost of the pieces it actually uses.
 """
 
-from . import command, config, credentialmanager, logger, model, output, updatechecker
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static view of the lazy submodules, so type checkers resolve
+    # cac_core.<submodule> to the real module instead of Any.
+    from . import (
+        command,
+        config,
+        credentialmanager,
+        logger,
+        model,
+        output,
+        updatechecker,
+    )
 
 __all__ = [
     "command",
@@ -16,3 +33,18 @@ __all__ = [
     "output",
     "updatechecker",
 ]
+
+_LAZY_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name):
+    """Import a public submodule on first access and cache it on the package."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
@@ -8,6 +8,7 @@ that as a console-script callable.
 """
 
 import argparse
+import functools
 import importlib
 import logging
 import os
@@ -56,6 +57,44 @@ def _discover_actions(command_dir):
     return actions
 
 
+def _direct_target(argv, commands_dir):
+    """Return ``(command, action)`` when ``argv`` names a single action outright.
+
+    This is the runner's fast path: for an ordinary invocation such as ``jira
+    issue list --mine`` only that one action module needs importing and only its
+    branch of the parser needs building. Anything that needs the whole command
+    tree -- shell completion, ``--help``/``-h`` before the action, an unknown
+    command or action -- returns ``None`` so the full parser is built instead.
+
+    Only ``--verbose`` may precede the action: it is the sole option the
+    top-level and command parsers define, so any other leading option is left
+    for the full parser to accept or reject.
+    """
+    if os.environ.get("_ARGCOMPLETE"):
+        return None
+    positionals = []
+    for token in argv:
+        if token == "--verbose":
+            continue
+        if token.startswith("-"):
+            return None
+        positionals.append(token)
+        if len(positionals) == 2:
+            break
+    if len(positionals) != 2:
+        return None
+    command, action = positionals
+    if command.startswith("_") or action.startswith("_"):
+        return None
+    command_dir = os.path.join(commands_dir, command)
+    if not (
+        os.path.isfile(os.path.join(command_dir, "__init__.py"))
+        and os.path.isfile(os.path.join(command_dir, f"{action}.py"))
+    ):
+        return None
+    return command, action
+
+
 def _setup_logging(log, package, verbose):
     """Raise every ``<package>*`` logger to DEBUG when ``--verbose`` is set.
 
@@ -72,37 +111,27 @@ def _setup_logging(log, package, verbose):
             existing.setLevel(logging.DEBUG)
 
 
-def run(package, prog, description=""):
-    """Run a ``cac-*`` CLI: discover commands/actions, parse, and dispatch.
+@functools.lru_cache(maxsize=32)
+def _cached_parser(pkg, prog, description, commands_dir, target, log):
+    """
+    Return the parser run() uses for one invocation shape, memoized.
+
+    Building the tree imports every action module and runs its
+    define_arguments, so a process that dispatches repeatedly (test suites,
+    REPLs, daemons) only pays that once per distinct invocation shape. The
+    package *module object* is part of the key, so re-importing the package
+    (e.g. after it is dropped from sys.modules) naturally misses the cache.
+    The cache is bounded because each parser keeps its action classes alive.
+    """
+    return _build_parser(log, pkg.__name__, prog, description, commands_dir, target)
 
-    This is the shared entry point for CAC command-line tools. It scans
-    ``<package>/commands/`` for command packages and their action modules,
-    builds a nested ``argparse`` parser (``<prog> <command> <action> [opts]``),
-    wires up shell completion via ``argcomplete`` when available, then executes
-    the selected action.
 
-    Action classes are discovered by the ``{Command}{Action}`` naming
-    convention (e.g. ``commands/issue/create.py`` -> ``IssueCreate``) and must
-    implement ``define_arguments(parser)`` and ``execute(args)``.
+def _build_parser(log, package, prog, description, commands_dir, target):
+    """Build the nested ``argparse`` tree for ``package``.
 
-    Args:
-        package (str): Importable package name to scan (e.g. ``"cac_jira"``).
-        prog (str): Program name shown in help/usage (e.g. ``"jira"``).
-        description (str): Short description for the top-level parser.
-
-    Returns:
-        int: Exit code -- ``0`` on success, non-zero on failure. Callers are
-        responsible for turning a non-zero return into ``sys.exit``.
+    When ``target`` is a ``(command, action)`` pair only that branch is built;
+    otherwise every discovered command and action is registered.
     """
-    log = cac_logger.new(f"{package}.cli")
-    log.propagate = False
-
-    pkg = importlib.import_module(package)
-    if not pkg.__file__:
-        log.error("Cannot locate the '%s' package on disk", package)
-        return 1
-    commands_dir = os.path.join(os.path.dirname(pkg.__file__), "commands")
-
     # Parent parser for arguments shared by every level of the command tree.
     # ``--verbose`` lives here (rather than only on the leaf action parsers) so
     # it is accepted before *or* after the subcommand -- ``jira --verbose issue
@@ -121,8 +150,12 @@ def run(package, prog, description=""):
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    commands = _discover_commands(commands_dir)
-    log.debug("Discovered commands: %s", commands)
+    if target:
+        commands = [target[0]]
+        log.debug("Building parser for %s %s only", *target)
+    else:
+        commands = _discover_commands(commands_dir)
+        log.debug("Discovered commands: %s", commands)
 
     command_subparsers = {}
     for command in commands:
@@ -136,10 +169,15 @@ def run(package, prog, description=""):
         )
 
     # Build every action parser up front so completion and --help see the full
-    # command tree. Failures for a single action are logged and skipped rather
-    # than aborting the whole CLI.
+    # command tree (or just the targeted action on the fast path). Failures for
+    # a single action are logged and skipped rather than aborting the whole CLI.
     for command, subparser in command_subparsers.items():
-        for action in _discover_actions(os.path.join(commands_dir, command)):
+        actions = (
+            [target[1]]
+            if target
+            else _discover_actions(os.path.join(commands_dir, command))
+        )
+        for action in actions:
             module_path = f"{package}.commands.{command}.{action}"
             try:
                 module = importlib.import_module(module_path)
@@ -161,6 +199,45 @@ def run(package, prog, description=""):
             except Exception as e:  # pylint: disable=broad-except
                 log.warning("Error setting up %s %s: %s", command, action, e)
 
+    return parser
+
+
+def run(package, prog, description=""):
+    """Run a ``cac-*`` CLI: discover commands/actions, parse, and dispatch.
+
+    This is the shared entry point for CAC command-line tools. It scans
+    ``<package>/commands/`` for command packages and their action modules,
+    builds a nested ``argparse`` parser (``<prog> <command> <action> [opts]``),
+    wires up shell completion via ``argcomplete`` when available, then executes
+    the selected action.
+
+    Action classes are discovered by the ``{Command}{Action}`` naming
+    convention (e.g. ``commands/issue/create.py`` -> ``IssueCreate``) and must
+    implement ``define_arguments(parser)`` and ``execute(args)``.
+
+    Args:
+        package (str): Importable package name to scan (e.g. ``"cac_jira"``).
+        prog (str): Program name shown in help/usage (e.g. ``"jira"``).
+        description (str): Short description for the top-level parser.
+
+    Returns:
+        int: Exit code -- ``0`` on success, non-zero on failure. Callers are
+        responsible for turning a non-zero return into ``sys.exit``.
+    """
+    log = cac_logger.new(f"{package}.cli")
+    log.propagate = False
+
+    pkg = importlib.import_module(package)
+    if not pkg.__file__:
+        log.error("Cannot locate the '%s' package on disk", package)
+        return 1
+    commands_dir = os.path.join(os.path.dirname(pkg.__file__), "commands")
+
+    # Build only the requested branch when argv names it outright; otherwise
+    # discover and build the full tree (help, completion, and error paths).
+    target = _direct_target(sys.argv[1:], commands_dir)
+    parser = _cached_parser(pkg, prog, description, commands_dir, target, log)
+
     # Shell-completion hook. Must run after the parser is fully built (so the
     # completer sees every command/action/flag) and before parse_args. Guarded
     # so a missing optional dependency degrades to no completion, not a crash.
@@ -10,6 +10,27 @@ import abc
 import logging
 from typing import Any, Dict, Optional
 
+# Arguments every command accepts, as (dest, flag, add_argument kwargs). Kept as
+# one table so define_common_arguments stays a single loop as the set grows.
+_COMMON_ARG_SPECS = (
+    (
+        "output",
+        "--output",
+        {
+            "help": "Output format",
+            "choices": ["json", "table"],
+            "default": "table",
+            "type": str,
+            "metavar": "FORMAT",
+        },
+    ),
+    (
+        "verbose",
+        "--verbose",
+        {"help": "Verbose output", "action": "store_true", "default": False},
+    ),
+)
+
 
 class CommandError(Exception):
     """Exception raised for command execution errors."""
@@ -29,19 +50,25 @@ class Command(metaclass=abc.ABCMeta):
     provides utility methods for output formatting.
 
     Attributes:
-        log (Logger): Logger instance for the command
+        log (Logger): Logger for the command, shared by all instances of a class
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the logger once per command class rather than on every
+        # instantiation. Namespace it under the command's package (e.g.
+        # ``cac_jira.commands.issue.show.IssueShow``) rather than the bare class
+        # name: the shared runner's ``--verbose`` handling raises every logger
+        # whose name starts with the tool package, so a bare ``IssueShow``
+        # logger would be silently missed. A subclass that declares its own
+        # ``log`` keeps it.
+        if "log" not in cls.__dict__:
+            cls.log = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self, log_level: Optional[int] = None):
         """
         Initialize the command.
         """
-        # Namespace the logger under the command's package (e.g.
-        # ``cac_jira.commands.issue.show.IssueShow``) rather than the bare class
-        # name. The shared runner's ``--verbose`` handling raises every logger
-        # whose name starts with the tool package, so a bare ``IssueShow`` logger
-        # would be silently missed.
-        self.log = logging.getLogger(f"{type(self).__module__}.{type(self).__name__}")
         if log_level is not None:
             self.log.setLevel(log_level)
 
@@ -53,23 +80,12 @@ class Command(metaclass=abc.ABCMeta):
         Args:
             parser (ArgumentParser): The argument parser to add arguments to
         """
-        has_output = any(action.dest == "output" for action in parser._actions)
-        if not has_output:
-            parser.add_argument(
-                "--output",
-                help="Output format",
-                choices=["json", "table"],
-                default="table",
-                type=str,
-                metavar="FORMAT",
-            )
-
-        # Check if the verbose argument already exists
-        has_verbose = any(action.dest == "verbose" for action in parser._actions)
-        if not has_verbose:
-            parser.add_argument(
-                "--verbose", help="Verbose output", action="store_true", default=False
-            )
+        # One pass over the registered actions; each common argument below is
+        # then an O(1) membership test rather than its own linear scan.
+        dests = {action.dest for action in parser._actions}
+        for dest, flag, kwargs in _COMMON_ARG_SPECS:
+            if dest not in dests:
+                parser.add_argument(flag, **kwargs)
 
     @abc.abstractmethod
     def define_arguments(self, parser) -> Any:
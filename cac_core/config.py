@@ -1,4 +1,4 @@
-# pylint: disable=line-too-long, broad-exception-caught
+# pylint: disable=line-too-long
 
 """
 Configuration module for the CAC Core package.
@@ -9,16 +9,148 @@ and configuration files. It supports multiple environments and hierarchical
 configuration structures.
 """
 
+import copy
+import functools
 import logging
 import os
+import shutil
 import sys
+import tempfile
 from typing import Any
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
 
+def _parse_yaml_file(path):
+    """
+    Parse a YAML file with PyYAML's safe loader (imported on demand).
+
+    Uses the libyaml-backed ``CSafeLoader`` when PyYAML was built with it,
+    falling back to the pure-Python ``SafeLoader`` otherwise. The file is read
+    in one call and handed to the loader as bytes, so decoding happens inside
+    the parser rather than through a text-mode stream.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        raw = f.read()
+    return yaml.load(raw, Loader=loader)
+
+
+def _dump_yaml_file(data, path):
+    """
+    Write ``data`` to ``path`` as YAML, preferring libyaml's ``CSafeDumper``.
+
+    The document is serialized in memory first. If the file already holds
+    exactly those bytes nothing is written; otherwise the bytes go to a
+    uniquely named sibling ``.tmp`` file that is atomically renamed over
+    ``path``, so neither a crash mid-write nor two processes saving at once
+    can leave a truncated or interleaved config behind. A symlinked ``path``
+    is written through to its target, and an existing file keeps its mode.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    raw = yaml.dump(data, Dumper=dumper, encoding="utf-8")
+
+    try:
+        with open(path, "rb") as f:
+            if f.read() == raw:
+                return
+    except OSError:
+        pass
+
+    # Replace the symlink's target rather than the link itself (dotfile
+    # setups commonly symlink the config), staging next to the target.
+    path = os.path.realpath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        # mkstemp creates the file 0600; keep the existing config's mode.
+        try:
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_user_config(path, mtime_ns, size):  # pylint: disable=unused-argument
+    """
+    Memoized parse of a user config file.
+
+    ``mtime_ns`` and ``size`` are not used directly; they are part of the cache
+    key so that any rewrite of the file (by ``save()`` or by hand) misses the
+    cache and is parsed afresh.
+    """
+    return _parse_yaml_file(path)
+
+
+def _read_user_config(path):
+    """
+    Return the parsed contents of the user config file at ``path``.
+
+    Re-reading an unchanged file in the same process is a stat plus a dict copy
+    instead of a full YAML parse. Errors propagate to the caller exactly as an
+    uncached parse would; in particular a missing file raises
+    ``FileNotFoundError`` from the stat.
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_parse_user_config(path, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_key(key):
+    """Split a dotted config key into its parts, memoized per key string."""
+    return tuple(key.split("."))
+
+
+@functools.cache
+def _read_default_config(default_config_file):
+    """
+    Parse a module's shipped default config file, memoized per path.
+
+    Default configs ship inside the installed package and are read-only at
+    runtime, so constructing several ``Config`` objects for the same module in
+    one process (tests, plugin loaders) only parses the YAML once. Callers must
+    treat the returned dict as immutable and copy it before modifying.
+
+    Args:
+        default_config_file (str): Path to ``<module>/config/<module>.yaml``.
+
+    Returns:
+        dict: The parsed default configuration, or an empty dict if the file is
+        missing or invalid.
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    try:
+        loaded_config = _parse_yaml_file(default_config_file) or {}
+        if not isinstance(loaded_config, dict):
+            raise ValueError("default config is not a mapping")
+        return loaded_config
+    except FileNotFoundError:
+        # Most modules ship no default config; that is not an error.
+        return {}
+    except (yaml.YAMLError, OSError, ValueError) as e:
+        logger.error(
+            "Failed to load default config from %s: %s", default_config_file, e
+        )
+        return {}
+
+
 class Config:
     """
     Configuration manager for CAC applications.
@@ -40,6 +172,8 @@ class Config:
         config_file (str): Path to the user's configuration file
     """
 
+    __slots__ = ("config", "config_dir", "config_file", "env_prefix", "module_name")
+
     def __init__(self, module_name, env_prefix=None):
         """
         Initialize a new Config instance.
@@ -51,7 +185,48 @@ class Config:
                                        config values. If None, defaults to module_name converted
                                        to uppercase with hyphens replaced by underscores.
         """
-        # Set instance variables first
+        self._init_state(module_name, env_prefix)
+
+        # Now load the configuration
+        self.config = self.load(module_name)
+
+        # Load env vars after loading config
+        self._load_env_vars()
+
+        self._warn_shadowed_keys()
+
+    @classmethod
+    def from_dict(cls, module_name, data, env_prefix=None):
+        """
+        Build a Config directly from an in-memory dict.
+
+        No default or user config file is read, nothing is written to disk, and
+        environment variables are not applied: the instance holds exactly
+        ``data``. Useful for tests and for callers that already have their
+        settings in hand. ``config_file`` still points at the usual user config
+        path, so a later ``save()`` persists to the normal location.
+
+        Args:
+            module_name (str): The name of the module this configuration belongs to.
+            data (dict): The configuration values. Used as-is, not copied.
+            env_prefix (str, optional): As for ``Config()``.
+
+        Returns:
+            Config: The new instance.
+
+        Example:
+            >>> config = Config.from_dict('myapp', {'server': {'port': 8080}})
+            >>> config.get('server.port')
+            8080
+        """
+        config = cls.__new__(cls)
+        config._init_state(module_name, env_prefix)
+        config.config = data
+        config._warn_shadowed_keys()
+        return config
+
+    def _init_state(self, module_name, env_prefix):
+        """Set the instance attributes shared by every construction path."""
         self.module_name = module_name
         # Default to module_name as prefix if None provided
         self.env_prefix = (
@@ -59,37 +234,50 @@ class Config:
             if env_prefix is not None
             else module_name.upper().replace("-", "_")
         )
-        self.config_file = os.path.expanduser(
-            os.path.join("~", ".config", module_name, "config.yaml")
-        )
-        self.config_dir = os.path.dirname(self.config_file)
+        # Derive both paths from one expanduser() call; the directory is the
+        # base and the file is joined onto it rather than split back out.
+        self.config_dir = os.path.join(os.path.expanduser("~"), ".config", module_name)
+        self.config_file = os.path.join(self.config_dir, "config.yaml")
 
-        # Initialize config with empty dict, will be populated by load()
+        # Initialize config with empty dict, will be populated by the caller
         self.config = {}
 
-        # Now load the configuration
-        self.config = self.load(module_name)
-
-        # Load env vars after loading config
-        self._load_env_vars()
+    def _warn_shadowed_keys(self):
+        """
+        Warn about top-level keys that cannot be read as attributes.
 
-        # Add each config key-value pair as an object attribute
-        # Done after env var loading so attributes reflect overrides.
-        # Skip keys that would shadow existing methods or instance attributes
-        # (e.g. get/set/save/load, or config/config_file/env_prefix) or private
-        # attributes; those remain accessible via get()/dict-style access
-        # instead of clobbering the class API or internal state. hasattr(self,
-        # ...) covers both class members and already-set instance attributes.
-        for key, value in self.config.items():
-            if key.startswith("_") or hasattr(self, key):
+        Top-level config keys are readable as attributes via __getattr__,
+        which reads the live dict so attributes always reflect env overrides
+        and later set() calls. Keys that would shadow Config's own methods or
+        state (or private names) are never reachable that way; flag them once
+        so the user knows to use get()/dict-style access instead.
+        """
+        for key in self.config:
+            if self._would_shadow_internal(key):
                 logger.warning(
                     "Config key %r collides with a reserved attribute; "
                     "not exposing it as an attribute (use get(%r) instead).",
                     key,
                     key,
                 )
-                continue
-            setattr(self, key, value)
+
+    def __getattr__(self, name):
+        """
+        Expose top-level config keys as read-only attributes.
+
+        Only called when normal attribute lookup fails, so methods and
+        Config's own instance state always take precedence over config keys.
+        """
+        if name.startswith("_") or name in self._RESERVED_INSTANCE_ATTRS:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        try:
+            return self.config[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
 
     def _load_env_vars(self):
         """
@@ -102,28 +290,55 @@ class Config:
         For example, given the prefix "APP", the environment variable "APP_DATABASE_URL"
         would override the config key "database.url".
         """
-        for env_key, env_value in os.environ.items():
-            # Check if env var has our prefix
-            if not env_key.startswith(f"{self.env_prefix}_"):
-                continue
+        prefix = f"{self.env_prefix}_"
+        prefix_len = len(prefix)
+        matching = self._matching_env_vars(prefix)
+        if not matching:
+            return
 
+        config = self.config
+        coerce = self._coerce_env_value
+        for env_key, env_value in matching:
             # Remove prefix and convert to lowercase
-            raw_key = env_key[len(f"{self.env_prefix}_") :].lower()
+            raw_key = env_key[prefix_len:].lower()
 
             # Prefer an existing top-level key that matches literally (so keys
             # that legitimately contain underscores, e.g. "log_level", can be
-            # overridden); otherwise map underscores to dots for nested keys.
-            if raw_key in self.config:
-                config_key = raw_key
+            # overridden); that case is a plain dict write. Otherwise map
+            # underscores to dots and let set() walk/create the nested path.
+            # Either way, coerce the string env value to match the existing
+            # value's type, so numeric/boolean config values aren't silently
+            # turned to strings.
+            if raw_key in config:
+                config[raw_key] = coerce(raw_key, env_value)
             else:
                 config_key = raw_key.replace("_", ".")
+                self.set(config_key, coerce(config_key, env_value))
 
-            # Coerce the string env value to match the existing value's type,
-            # so numeric/boolean config values aren't silently turned to strings.
-            value = self._coerce_env_value(config_key, env_value)
+    @staticmethod
+    def _matching_env_vars(prefix):
+        """
+        Return ``(name, value)`` pairs for environment variables starting with
+        ``prefix``.
 
-            # Set the value in our config
-            self.set(config_key, value)
+        On POSIX the scan runs over ``os.environb`` so only matching entries are
+        decoded to ``str``; iterating ``os.environ`` would decode every variable
+        in the environment. The common case is that nothing matches. Platforms
+        without ``os.environb`` (Windows) filter ``os.environ`` directly.
+        """
+        environb = getattr(os, "environb", None)
+        if environb is None:
+            return [
+                (env_key, env_value)
+                for env_key, env_value in os.environ.items()
+                if env_key.startswith(prefix)
+            ]
+        bprefix = os.fsencode(prefix)
+        return [
+            (os.fsdecode(env_key), os.fsdecode(env_value))
+            for env_key, env_value in environb.items()
+            if env_key.startswith(bprefix)
+        ]
 
     def _coerce_env_value(self, config_key, env_value):
         """
@@ -154,14 +369,13 @@ class Config:
         Returns:
             dict: The loaded configuration or empty dict if file not found or invalid
         """
-        if not os.path.exists(self.config_file):
-            return {}
+        import yaml  # pylint: disable=import-outside-toplevel
 
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-                return config or {}
-        except Exception as e:
+            return _read_user_config(self.config_file) or {}
+        except FileNotFoundError:
+            return {}
+        except (yaml.YAMLError, OSError, ValueError) as e:
             logger.error("Error loading config from %s: %s", self.config_file, e)
             return {}
 
@@ -184,7 +398,7 @@ class Config:
             return self.config.get(key, default)
 
         # Handle nested keys
-        parts = key.split(".")
+        parts = _split_key(key)
         current = self.config
 
         # Navigate to the nested location
@@ -218,7 +432,7 @@ class Config:
             return
 
         # Handle nested keys
-        parts = key_path.split(".")
+        parts = _split_key(key_path)
         current = self.config
 
         # Navigate to the nested location, creating dictionaries as needed
@@ -271,46 +485,57 @@ class Config:
         # Get default configuration
         default_config = self._load_default_config(module_name)
 
-        # Create result config starting with defaults
-        config = default_config.copy()
+        # Create result config starting with defaults, plus the config file
+        # path, in a single dict display
+        config = {**default_config, "config_file_path": self.config_file}
 
-        # Add the config file path to the configuration
-        config["config_file_path"] = self.config_file
+        # Read the user config directly rather than probing for it first; the
+        # common case (file already exists) then costs a single stat.
+        import yaml  # pylint: disable=import-outside-toplevel
 
-        # Handle non-existent user config file
-        if not os.path.exists(self.config_file):
-            # Temporarily store default config and save it using self.save()
+        try:
+            user_config = _read_user_config(self.config_file)
+        except FileNotFoundError:
+            # Temporarily store default config and save it using self.save().
+            # default_config is already a private copy (see
+            # _load_default_config) and save() only reads it, so no second
+            # copy is needed here.
             temp_config = self.config  # Save current config (if any)
-            self.config = default_config.copy()
+            self.config = default_config
             self.save()  # Use the existing save method to create the file
             self.config = temp_config  # Restore current config
 
             # Return the default config with file path added
             return config
-
-        # Load and merge user configuration if it exists
-        try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                user_config = yaml.safe_load(f)
-                if user_config:
-                    # Deep-merge so a user override of one nested key does not
-                    # drop sibling default keys in the same subtree.
-                    config = self._deep_merge(config, user_config)
-        except Exception as e:
+        except (yaml.YAMLError, OSError, ValueError) as e:
             logger.error("Error reading user config file %s: %s", self.config_file, e)
+            return config
+
+        if isinstance(user_config, dict):
+            # Deep-merge so a user override of one nested key does not
+            # drop sibling default keys in the same subtree.
+            config = self._deep_merge(config, user_config)
+        elif user_config:
+            logger.error(
+                "Error reading user config file %s: top level is not a mapping",
+                self.config_file,
+            )
 
         return config
 
     @staticmethod
     def _deep_merge(base, override):
         """
-        Recursively merge ``override`` into ``base`` and return the result.
+        Merge ``override`` into ``base`` and return the result.
 
         Nested dictionaries are merged key-by-key so that overriding a single
         nested value preserves the other keys defined in the base dict. Any
         non-dict value (or a dict overriding a non-dict, and vice versa)
         replaces the base value outright.
 
+        The walk uses an explicit stack rather than recursion. Only the dicts
+        along merged paths are copied, so neither input is mutated.
+
         Args:
             base (dict): The base dictionary (e.g. default config).
             override (dict): The dictionary whose values take precedence.
@@ -319,15 +544,18 @@ class Config:
             dict: A new dictionary containing the merged result.
         """
         merged = dict(base)
-        for key, value in override.items():
-            if (
-                key in merged
-                and isinstance(merged[key], dict)
-                and isinstance(value, dict)
-            ):
-                merged[key] = Config._deep_merge(merged[key], value)
-            else:
-                merged[key] = value
+        stack = [(merged, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    # Copy before descending so the caller's nested dict in
+                    # ``base`` is left untouched.
+                    dst[key] = dict(current)
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
         return merged
 
     def _load_default_config(self, module_name):
@@ -353,22 +581,13 @@ class Config:
         if not module_path:
             return default_config
 
-        module_dir = os.path.dirname(module_path)
-        default_config_dir = os.path.join(module_dir, "config")
-        default_config_file = os.path.join(default_config_dir, f"{module_name}.yaml")
-
-        if os.path.exists(default_config_file):
-            try:
-                with open(default_config_file, "r", encoding="utf-8") as f:
-                    loaded_config = yaml.safe_load(f)
-                    if loaded_config:
-                        default_config.update(loaded_config)
-            except Exception as e:
-                logger.error(
-                    "Failed to load default config from %s: %s", default_config_file, e
-                )
+        default_config_file = os.path.join(
+            os.path.dirname(module_path), "config", f"{module_name}.yaml"
+        )
 
-        return default_config
+        # The parsed file is cached per process; hand back a deep copy so the
+        # caller's later set()/merge mutations can never leak into the cache.
+        return copy.deepcopy(_read_default_config(default_config_file))
 
     def save(self):
         """
@@ -384,23 +603,27 @@ class Config:
         Raises:
             None: Errors are caught and logged
         """
-        try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+        import yaml  # pylint: disable=import-outside-toplevel
 
+        try:
             # config_file_path is a runtime-derived convenience key, not user
             # data; don't persist it (or a stale absolute path) into the YAML.
             save_data = {
                 k: v for k, v in self.config.items() if k != "config_file_path"
             }
 
-            # Write the config to file
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                yaml.dump(save_data, f)
+            # Write the config to file, creating the parent directory only
+            # when the write fails for lack of it (i.e. on first run).
+            try:
+                _dump_yaml_file(save_data, self.config_file)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                _dump_yaml_file(save_data, self.config_file)
 
             return True
-        except (IOError, OSError) as e:
-            # Log error but don't crash
+        except (IOError, OSError, yaml.YAMLError) as e:
+            # Log error (including values the safe dumper can't represent)
+            # but don't crash
             logger.error(
                 "Failed to save configuration to %s: %s", self.config_file, str(e)
             )
@@ -425,17 +648,14 @@ class Config:
         self.config.update(update_dict)
 
     # Instance attributes that hold Config's own state. A config key must never
-    # overwrite these when its value is synced to an attribute -- unlike methods
-    # and class attributes, these are set per-instance and so are not caught by
-    # ``hasattr(type(self), key)``.
-    _RESERVED_INSTANCE_ATTRS = frozenset(
-        {"config", "module_name", "env_prefix", "config_file", "config_dir"}
-    )
+    # be served in their place by __getattr__ (e.g. while __init__ is still
+    # populating the slots).
+    _RESERVED_INSTANCE_ATTRS = frozenset(__slots__)
 
     def _would_shadow_internal(self, key):
-        """Return True if exposing ``key`` as an attribute would clobber Config's
-        own state or API (private names, methods/class attributes, or the
-        internal instance attributes above)."""
+        """Return True if ``key`` cannot be read as an attribute because it
+        names Config's own state or API (private names, methods/class
+        attributes, or the internal instance attributes above)."""
         return (
             key.startswith("_")
             or key in self._RESERVED_INSTANCE_ATTRS
@@ -497,11 +717,6 @@ class Config:
 
             if value or required:
                 self.set(key, value)
-                # Keep the convenience attribute in sync with the stored value
-                # (Config exposes non-colliding keys as attributes), unless the
-                # name would shadow Config's own state or API.
-                if not self._would_shadow_internal(key):
-                    setattr(self, key, value)
                 self.save()
                 wrote = True
 
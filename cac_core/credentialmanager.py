@@ -41,11 +41,8 @@ Example:
     ```
 """
 
-import getpass
 import logging
 
-import keyring
-
 logger = logging.getLogger(__name__)
 
 
@@ -85,6 +82,10 @@ class CredentialManager:
         self.module_name = module_name
         self.username = None
         self.credential = None
+        # Credentials already read from the keychain by this instance, keyed
+        # by username. Keychain reads are IPC round-trips, and CLIs often ask
+        # for the same credential more than once per run.
+        self._cache = {}
 
     def get_credential(self, username, description="credential", prompt=True):
         """
@@ -93,6 +94,9 @@ class CredentialManager:
         If the credential is not found and prompt is True, the user will be
         prompted to enter it, and it will be stored in the keychain.
 
+        Credentials found in the keychain are remembered by this instance, so
+        repeated lookups for the same username do not hit the keychain again.
+
         Args:
             username (str): The username associated with the credential
             description (str): Description of the credential for prompts
@@ -101,9 +105,20 @@ class CredentialManager:
         Returns:
             str: The retrieved credential string or None if not found and not prompted
         """
+        # keyring (and its platform backends, e.g. dbus/SecretStorage on Linux)
+        # is imported on first use so importing this module stays cheap.
+        import getpass  # pylint: disable=import-outside-toplevel
+
+        import keyring  # pylint: disable=import-outside-toplevel
+
         # Store username for reference
         self.username = username
 
+        credential_string = self._cache.get(username)
+        if credential_string:
+            self.credential = credential_string
+            return credential_string
+
         # Try to get credential from keychain. Guard against backend errors
         # (e.g. locked/unavailable keyring) so we degrade to a prompt rather
         # than crashing the caller, matching set/delete_credential behavior.
@@ -112,6 +127,8 @@ class CredentialManager:
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.error("Failed to read credential for %s: %s", username, e)
             credential_string = None
+        if credential_string:
+            self._cache[username] = credential_string
 
         # If not found and prompting is enabled
         if not credential_string and prompt:
@@ -139,6 +156,9 @@ class CredentialManager:
         Returns:
             bool: True if credential was successfully stored
         """
+        import keyring  # pylint: disable=import-outside-toplevel
+
+        self._cache.pop(username, None)
         try:
             keyring.set_password(self.module_name, username, credential_string)
             self.username = username
@@ -148,6 +168,39 @@ class CredentialManager:
             logger.error("Failed to store %s for %s: %s", description, username, e)
             return False
 
+    def set_credentials(self, credentials, description="credential"):
+        """
+        Store several credentials in the system keychain.
+
+        The keyring backend is fetched once and reused for every write.
+        A failure for one username is logged and does not stop the rest.
+        Unlike set_credential, this does not update ``username``/``credential``.
+
+        Args:
+            credentials (dict): Mapping of username to credential string
+            description (str): Description of the credentials (for logging)
+
+        Returns:
+            bool: True if every credential was successfully stored
+        """
+        import keyring  # pylint: disable=import-outside-toplevel
+
+        try:
+            backend = keyring.get_keyring()
+        except Exception as e:
+            logger.error("Failed to open keyring to store %s: %s", description, e)
+            return False
+
+        stored_all = True
+        for username, credential_string in credentials.items():
+            self._cache.pop(username, None)
+            try:
+                backend.set_password(self.module_name, username, credential_string)
+            except Exception as e:
+                logger.error("Failed to store %s for %s: %s", description, username, e)
+                stored_all = False
+        return stored_all
+
     def delete_credential(self, username):
         """
         Delete a credential from the system keychain.
@@ -158,6 +211,9 @@ class CredentialManager:
         Returns:
             bool: True if credential was successfully deleted
         """
+        import keyring  # pylint: disable=import-outside-toplevel
+
+        self._cache.pop(username, None)
         try:
             keyring.delete_password(self.module_name, username)
             if self.username == username:
@@ -19,6 +19,13 @@ Example:
 
 import logging
 
+# The default layouts are shared by every logger, so build their Formatters
+# once instead of on every new() call.
+_DEBUG_FORMAT = "%(asctime)s [%(levelname)s] (%(processName)s %(threadName)s) %(module)s:%(lineno)d: %(message)s"
+_INFO_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+_DEBUG_FORMATTER = logging.Formatter(_DEBUG_FORMAT)
+_INFO_FORMATTER = logging.Formatter(_INFO_FORMAT)
+
 
 def new(name, level=logging.INFO, format_string=None) -> logging.Logger:
     """
@@ -47,13 +54,12 @@ def new(name, level=logging.INFO, format_string=None) -> logging.Logger:
 
     # Choose the format: verbose (DEBUG or lower) gets the detailed layout.
     # Use <= so sub-DEBUG numeric levels also get the verbose format.
-    if not format_string:
-        if level <= logging.DEBUG:
-            format_string = "%(asctime)s [%(levelname)s] (%(processName)s %(threadName)s) %(module)s:%(lineno)d: %(message)s"
-        else:
-            format_string = "%(asctime)s [%(levelname)s] %(message)s"
-
-    formatter = logging.Formatter(format_string)
+    if format_string:
+        formatter = logging.Formatter(format_string)
+    elif level <= logging.DEBUG:
+        formatter = _DEBUG_FORMATTER
+    else:
+        formatter = _INFO_FORMATTER
 
     if not logger.handlers:
         sh = logging.StreamHandler()
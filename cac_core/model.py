@@ -13,7 +13,100 @@ and supports serialization to dictionaries and JSON for data exchange.
 
 import copy
 import json
-from typing import Any, Dict, List, Optional, Set, Tuple  # , Union
+from typing import Any, Dict, List, Optional, Tuple  # , Union
+
+# Instance attributes that hold Model's own state rather than field data.
+_INTERNAL_ATTRS = frozenset({"data", "_formatters", "_remove_keys"})
+
+# Exact types that serialize as themselves. Most row values are one of these,
+# so they skip the isinstance() checks entirely.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def json_default(value):
+    """
+    ``json.dumps`` hook that serializes Models, e.g.
+    ``json.dumps(models, default=json_default)``.
+
+    The encoder walks ``data`` (and any nested Models, through this same hook)
+    directly, so no intermediate ``to_dict()`` tree is built. Subclasses that
+    override ``to_dict()``, and any other object providing one, are
+    serialized from their own ``to_dict()``.
+    """
+    if isinstance(value, Model) and type(value).to_dict is Model.to_dict:
+        return value.data
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _on_path(node_id, chain):
+    """Return True if ``node_id`` appears in a ``(id, parent_chain)`` chain."""
+    while chain is not None:
+        if chain[0] == node_id:
+            return True
+        chain = chain[1]
+    return False
+
+
+def _empty_model():
+    """Create an empty plain Model without running ``__init__``."""
+    # Nested rows are filled in by the parent's worklist; skipping __init__
+    # (keys_to_remove resolution, an empty worklist) matters because every
+    # nested dict of every row becomes one of these.
+    model = Model.__new__(Model)
+    _set = object.__setattr__
+    _set(model, "data", {})
+    _set(model, "_formatters", {})
+    _set(model, "_remove_keys", [])
+    return model
+
+
+def _child_chain(row, chain):
+    """Extend ``chain`` with ``row``, raising ValueError if it is an ancestor."""
+    row_id = id(row)
+    if _on_path(row_id, chain):
+        raise ValueError("Circular reference detected")
+    return (row_id, chain)
+
+
+def _to_plain(root):
+    """
+    Convert ``root``'s data to plain dicts and lists, without recursion.
+
+    ``root`` is always expanded from its own ``data``. Nested Models are
+    expanded the same way unless their class overrides ``to_dict()``, which is
+    then called instead. Containers are filled from an explicit stack, so deep
+    trees cost no Python frames per level. A container reached again through
+    its own descendants raises ValueError, as json.dumps would.
+    """
+    result = {}
+    seen = {id(root)}
+    stack = [(result, root.data.items(), (id(root), None))]
+    while stack:
+        out, pairs, chain = stack.pop()
+        for slot, value in pairs:
+            if type(value) in _SCALAR_TYPES:  # pylint: disable=unidiomatic-typecheck
+                out[slot] = value
+                continue
+            if isinstance(value, Model):
+                if type(value).to_dict is not Model.to_dict:
+                    out[slot] = value.to_dict()
+                    continue
+                child, items = {}, value.data.items()
+            elif isinstance(value, list):
+                child, items = [None] * len(value), enumerate(value)
+            else:
+                out[slot] = value
+                continue
+            # A shared (DAG) child is fine; only an ancestor means a cycle.
+            node_id = id(value)
+            if node_id in seen and _on_path(node_id, chain):
+                raise ValueError("Circular reference detected")
+            seen.add(node_id)
+            out[slot] = child
+            stack.append((child, items, (node_id, chain)))
+    return result
 
 
 class Model:
@@ -26,48 +119,84 @@ class Model:
     methods for converting to dictionaries and JSON for data exchange.
 
     Attributes:
-        data (dict): The underlying data dictionary.
-        field_names (set): Set of dynamically created attribute names.
+        data (dict): The underlying data dictionary. Its insertion order is
+            the model's key order.
+        field_names (KeysView): Read-only, set-like view of the field names.
     """
 
+    # Models are often created by the thousand (one per API result row), so
+    # drop the per-instance __dict__. Subclasses that don't declare __slots__
+    # get a __dict__ back and can set their own attributes as usual.
+    __slots__ = tuple(sorted(_INTERNAL_ATTRS))
+
     def __init__(
         self, row_data: Dict[str, Any], keys_to_remove: Optional[List[str]] = None
     ) -> None:
-        self.field_names: Set[str] = set()
-        self.data: Dict[str, Any] = {}
-        self._key_order: List[str] = []
-        self._formatters: Dict[str, Any] = {}
-        self._remove_keys: List[str] = []
+        # Internal slots bypass the field-routing __setattr__; this runs once
+        # per row and per nested row, so the Python-level hook adds up.
+        _set = object.__setattr__
+        _set(self, "data", {})
+        _set(self, "_formatters", {})
+        _set(self, "_remove_keys", [])
 
         if keys_to_remove is None:
             keys_to_remove = self.remove_keys()
-
-        for key, value in row_data.items():
-            if key in keys_to_remove:
-                continue
-
-            self.field_names.add(key)
-            self._key_order.append(key)  # Track insertion order
-            # Dynamically create getter and setter methods for each key
-            self.add_key(key, value)
-
-            if isinstance(value, list):
-                self.data[key] = [
-                    Model(val, keys_to_remove) if isinstance(val, dict) else val
-                    for val in value
-                ]
-            elif isinstance(value, dict):
-                self.data[key] = Model(value, keys_to_remove)
-            else:
-                self.data[key] = value
+        # Checked once per key of every nested row; make membership O(1).
+        # frozenset() of a frozenset is a no-op, so child Models reuse it.
+        keys_to_remove = frozenset(keys_to_remove)
+
+        # Nested dicts become empty child Models that are filled from this
+        # worklist instead of by recursive Model() construction, so a deeply
+        # nested payload costs no extra Python frames (or RecursionError).
+        # Each entry carries its chain of ancestor dict ids, so a dict reached
+        # again through its own descendants raises instead of looping forever.
+        pending = [(self, row_data, (id(row_data), None))]
+        while pending:
+            node, row, chain = pending.pop()
+            # Bind the per-key targets once; this loop runs for every key of
+            # every row, so attribute lookups add up across large result sets.
+            # ``data`` preserves insertion order, so it doubles as key order.
+            # The base add_key is a no-op hook; only call it when overridden.
+            data = node.data
+            add_key = node.add_key if type(node).add_key is not Model.add_key else None
+
+            for key, value in row.items():
+                if key in keys_to_remove:
+                    continue
+
+                if add_key is not None:
+                    add_key(key, value)
+
+                if type(value) in _SCALAR_TYPES:  # pylint: disable=unidiomatic-typecheck
+                    data[key] = value
+                elif isinstance(value, list):
+                    items = []
+                    for val in value:
+                        if isinstance(val, dict):
+                            child = _empty_model()
+                            pending.append((child, val, _child_chain(val, chain)))
+                            val = child
+                        items.append(val)
+                    data[key] = items
+                elif isinstance(value, dict):
+                    child = _empty_model()
+                    pending.append((child, value, _child_chain(value, chain)))
+                    data[key] = child
+                else:
+                    data[key] = value
+
+    @property
+    def field_names(self):
+        """Read-only, set-like view of the model's field names."""
+        return self.data.keys()
 
     def add_key(self, key, value):
         """
         Registers a key in the model's field tracking.
 
-        Attribute access for registered keys is handled by __getattr__,
-        which routes reads to self.data per-instance rather than creating
-        class-level property descriptors.
+        Attribute access for registered keys is handled by __getattr__ and
+        __setattr__, which route reads and writes to self.data per-instance
+        rather than creating class-level property descriptors.
 
         Args:
             key (str): The key to add to the model.
@@ -77,32 +206,50 @@ class Model:
 
     def __getattr__(self, name):
         """Route attribute access to self.data for known field names."""
-        if "field_names" in self.__dict__ and name in self.__dict__["field_names"]:
-            return self.__dict__["data"].get(name)
+        # Only reached when normal lookup fails. An internal slot that is not
+        # set yet (mid-__init__/copy) must not recurse back in here.
+        if name not in _INTERNAL_ATTRS:
+            try:
+                data = object.__getattribute__(self, "data")
+            except AttributeError:
+                data = {}
+            if name in data:
+                return data[name]
 
         raise AttributeError(
             f"'{type(self).__name__}' object has no attribute '{name}'"
         )
 
+    def __setattr__(self, name, value):
+        """
+        Route assignment to a known field through __setitem__.
+
+        Without this, ``model.name = "x"`` would create an instance attribute
+        that shadows the field, leaving ``data``/``to_dict()`` unchanged.
+        Model's own bookkeeping attributes are always set directly. Any other
+        name is never added as a field by assignment (use ``model[key] = ...``
+        for that): subclasses without ``__slots__`` get an ordinary instance
+        attribute, and a plain Model (which has no ``__dict__``, see
+        ``__slots__``) raises AttributeError.
+        """
+        if name not in _INTERNAL_ATTRS and name in getattr(self, "data", ()):
+            self[name] = value
+            return
+        object.__setattr__(self, name, value)
+
     def __iter__(self):
         # Mapping protocol: iterating a Model yields its keys (in insertion
         # order), consistent with dict and with keys(). Use items() for
         # key/value pairs and values() for values.
-        for key in self._key_order:
-            yield key
+        yield from self.data
 
     def items(self) -> List[Tuple[str, Any]]:
         """Returns key-value pairs as a list of tuples"""
-        result = []
-        for key in self._key_order:
-            # Get the actual value from data dictionary instead of using getattr
-            value = self.data.get(key)
-            result.append((key, value))
-        return result
+        return list(self.data.items())
 
     def values(self) -> List[Any]:
         """Returns values as a list"""
-        return [self.data.get(key) for key in self._key_order]
+        return list(self.data.values())
 
     def __str__(self):
         return f"#<{self.__class__.__name__} {self.current_state()}>"
@@ -114,7 +261,7 @@ class Model:
         Returns:
             str: A JSON string representation of the model.
         """
-        return json.dumps(self.to_dict())
+        return json.dumps(self, default=json_default)
 
     # def __eq__(self, other):
     #     return self.current_state() == other.current_state()
@@ -126,8 +273,8 @@ class Model:
         Returns:
             list: A list of all keys in the model in insertion order.
         """
-        # Return a copy so callers cannot mutate the model's private ordering.
-        return list(self._key_order)
+        # Return a copy so callers cannot mutate the model's key order.
+        return list(self.data)
 
     def to_dict(self):
         """
@@ -137,10 +284,7 @@ class Model:
             dict: A dictionary containing all key-value pairs from the model,
                   with nested models also converted to dictionaries.
         """
-        # More efficient implementation using comprehension
-        return {
-            key: self._process_results(self.data.get(key)) for key in self._key_order
-        }
+        return _to_plain(self)
 
     def remove_keys(self):
         """
@@ -170,14 +314,8 @@ class Model:
         Returns:
             str: A string representation of the model's current state.
         """
-        return " ".join(f"{key}={self.data.get(key)}" for key in self._key_order)
-
-    def _process_results(self, value):
-        if isinstance(value, Model):
-            return value.to_dict()
-        if isinstance(value, list):
-            return [self._process_results(val) for val in value]
-        return value
+        # A list lets str.join size the result in one pass over its input.
+        return " ".join([f"{key}={value}" for key, value in self.data.items()])
 
     def get(self, key, default=None):
         """
@@ -192,21 +330,15 @@ class Model:
         Returns:
             The value associated with the key, or the default value.
         """
-        if key in self.field_names:
-            return self.data.get(key)
-        return default
+        return self.data.get(key, default)
 
     def __getitem__(self, key):
         """Dictionary-style access with model[key]"""
-        if key in self.field_names:
-            return self.data.get(key)
-        raise KeyError(key)
+        return self.data[key]
 
     def __setitem__(self, key, value):
         """Dictionary-style assignment with model[key] = value"""
-        if key not in self.field_names:
-            self.field_names.add(key)
-            self._key_order.append(key)
+        if key not in self.data:
             self.add_key(key, value)
         # Wrap nested dicts/lists in Model like __init__ does, so nested
         # attribute access works regardless of how the value was set.
@@ -221,39 +353,37 @@ class Model:
 
     def __contains__(self, key):
         """Support for 'in' operator: key in model"""
-        return key in self.field_names
+        return key in self.data
 
     def __len__(self):
         """Support for len(model)"""
-        return len(self.field_names)
+        return len(self.data)
 
     def __repr__(self) -> str:
         """Developer-friendly string representation"""
         class_name = self.__class__.__name__
         attrs = ", ".join(f"{k}={repr(v)}" for k, v in list(self.items())[:3])
-        if len(self.field_names) > 3:
+        if len(self.data) > 3:
             attrs += ", ..."
         return f"{class_name}({attrs})"
 
     def __copy__(self):
         """Support for copy.copy(model)"""
         new_model = self.__class__({}, [])
-        new_model.data = copy.copy(self.data)
-        new_model.field_names = copy.copy(self.field_names)
-        new_model._key_order = copy.copy(self._key_order)
-        new_model._formatters = copy.copy(self._formatters)
-        new_model._remove_keys = copy.copy(self._remove_keys)
+        _set = object.__setattr__
+        _set(new_model, "data", copy.copy(self.data))
+        _set(new_model, "_formatters", copy.copy(self._formatters))
+        _set(new_model, "_remove_keys", copy.copy(self._remove_keys))
         return new_model
 
     def __deepcopy__(self, memo):
         """Support for copy.deepcopy(model)"""
         new_model = self.__class__({}, [])
         memo[id(self)] = new_model
-        new_model.data = copy.deepcopy(self.data, memo)
-        new_model.field_names = copy.deepcopy(self.field_names, memo)
-        new_model._key_order = copy.deepcopy(self._key_order, memo)
-        new_model._formatters = copy.deepcopy(self._formatters, memo)
-        new_model._remove_keys = copy.deepcopy(self._remove_keys, memo)
+        _set = object.__setattr__
+        _set(new_model, "data", copy.deepcopy(self.data, memo))
+        _set(new_model, "_formatters", copy.deepcopy(self._formatters, memo))
+        _set(new_model, "_remove_keys", copy.deepcopy(self._remove_keys, memo))
         return new_model
 
     def validate(self) -> List[str]:
@@ -13,6 +13,37 @@ import logging
 
 import tabulate
 
+from cac_core.model import json_default
+
+# Exact cell types rendered as-is (see _cell_value).
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _cell_value(value):
+    """Flatten one table cell: lists are comma-joined, nested data is JSON."""
+    # Most cells are plain scalars; one type lookup lets them skip the
+    # list/to_dict/dict checks below.
+    if type(value) in _SCALAR_TYPES:  # pylint: disable=unidiomatic-typecheck
+        return value
+    if isinstance(value, list):
+        return ", ".join(map(_list_item_text, value))
+    if hasattr(value, "to_dict"):
+        return json.dumps(value.to_dict())
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+
+def _list_item_text(item):
+    """Render one element of a list-valued table cell."""
+    if type(item) in _SCALAR_TYPES:  # pylint: disable=unidiomatic-typecheck
+        return str(item)
+    if hasattr(item, "to_dict"):
+        return json.dumps(item.to_dict())
+    if isinstance(item, dict):
+        return json.dumps(item)
+    return str(item)
+
 
 class Output:
     """
@@ -29,7 +60,19 @@ class Output:
 
     def __init__(self, params):
         self.opts = params
-        self.logger = self.__create_logger()
+        self._logger = None
+
+    @property
+    def logger(self):
+        """The "OutputTable" logger, configured on first use."""
+        # JSON output never logs, so don't configure the logger until needed.
+        if self._logger is None:
+            self._logger = self.__create_logger()
+        return self._logger
+
+    @logger.setter
+    def logger(self, value):
+        self._logger = value
 
     def print_models(self, data_models, table_options=None):
         """
@@ -93,15 +136,14 @@ class Output:
             return
 
         if output_format == "table":
-            # For table output, resolve models (flatten complex structures)
-            data_models = (
-                list(data_models) if isinstance(data_models, list) else [data_models]
-            )
+            # Wrap a single model in a list. A list is only read from here
+            # on, so it is used as-is rather than copied.
+            if not isinstance(data_models, list):
+                data_models = [data_models]
             if not data_models:
                 self.logger.info("No results were found")
                 return
-            resolved = self.__resolve_models(data_models)
-            self.__output_to_table(resolved, table_options)
+            self.__output_to_table(data_models, table_options)
 
     def _get_param(self, key, default=None):
         """
@@ -146,15 +188,10 @@ class Output:
         logger.propagate = False
         return logger
 
-    def __models_to_dict(self, data_models):
-        return (
-            [model.to_dict() for model in data_models]
-            if isinstance(data_models, list)
-            else data_models.to_dict()
-        )
-
     def __output_to_json(self, data_models):
-        print(json.dumps(self.__models_to_dict(data_models)))
+        # Let the encoder walk each model's data directly (see json_default)
+        # instead of first building a to_dict() copy of every model.
+        print(json.dumps(data_models, default=json_default))
 
     def __output_to_table(self, data_models, table_options=None):
         if not data_models:
@@ -180,14 +217,21 @@ class Output:
         # Display headers honor any custom header mappings
         headers = [header_map.get(key, key) for key in columns]
 
+        # Pull and flatten each row's cells with C-level map() calls over the
+        # column list (rows may lack some columns, hence .get rather than
+        # itemgetter), then apply formatters only to the columns that have
+        # one. Flattening happens here, once per cell, and never writes back
+        # into the caller's models.
+        formatted = [
+            (index, formatters[key])
+            for index, key in enumerate(columns)
+            if key in formatters
+        ]
         table_data = []
         for model in data_models:
-            row = []
-            for key in columns:
-                value = model.get(key)
-                if key in formatters:
-                    value = formatters[key](value)
-                row.append(value)
+            row = list(map(_cell_value, map(model.get, columns)))
+            for index, formatter in formatted:
+                row[index] = formatter(row[index])
             table_data.append(row)
 
         # Per-column fixed widths, aligned with the column order (None = auto)
@@ -197,45 +241,17 @@ class Output:
             else None
         )
 
-        print(
-            tabulate.tabulate(
-                table_data,
-                headers,
-                tablefmt="pretty",
-                stralign="left",
-                numalign="right",
-                maxcolwidths=maxcolwidths,
-            )
+        table = tabulate.tabulate(
+            table_data,
+            headers,
+            tablefmt="pretty",
+            stralign="left",
+            numalign="right",
+            maxcolwidths=maxcolwidths,
         )
         row_count = len(table_data)
-        print(f"{row_count} {'row' if row_count == 1 else 'rows'}")
-
-    def __resolve_models(self, data_models):
-        # Build flattened plain-dict rows WITHOUT mutating the caller's models;
-        # rendering must not corrupt the caller's data as a side effect.
-        resolved = []
-        for model in data_models:
-            row = {}
-            for k, v in model.items():
-                if isinstance(v, list):
-                    row[k] = ", ".join(
-                        [
-                            (
-                                json.dumps(x.to_dict())
-                                if hasattr(x, "to_dict")
-                                else (json.dumps(x) if isinstance(x, dict) else str(x))
-                            )
-                            for x in v
-                        ]
-                    )
-                elif hasattr(v, "to_dict"):
-                    row[k] = json.dumps(v.to_dict())
-                elif isinstance(v, dict):
-                    row[k] = json.dumps(v)
-                else:
-                    row[k] = v
-            resolved.append(row)
-        return resolved
+        # One write for the table and its row-count footer.
+        print(f"{table}\n{row_count} {'row' if row_count == 1 else 'rows'}")
 
 
 # Example usage
@@ -6,18 +6,17 @@ This module allows any package to check for updates and notify the user when new
 It supports checking both cac-core itself and any dependent packages.
 """
 
+import atexit
+import functools
 import importlib.metadata
 import json
 import logging
 import os
 import sys
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import requests
-from packaging.version import InvalidVersion
-from packaging.version import parse as parse_version
-
 # Set up logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -31,6 +30,54 @@ if not logger.handlers:
 logger.propagate = False
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_version(version):
+    """Parse a version string, memoized; callers compare the same few repeatedly."""
+    # packaging (like requests below) is imported on first use so that
+    # importing this module stays cheap when no check actually runs.
+    from packaging.version import parse  # pylint: disable=import-outside-toplevel
+
+    return parse(version)
+
+
+@functools.cache
+def _http_session():
+    """
+    Return the process-wide HTTP session used for update checks.
+
+    Checking several packages (or PyPI and GitHub) in one process then reuses
+    pooled keep-alive connections instead of paying DNS, TCP and TLS setup on
+    every request.
+    """
+    import requests  # pylint: disable=import-outside-toplevel
+
+    session = requests.Session()
+    atexit.register(session.close)
+    return session
+
+
+@functools.cache
+def _installed_version(package_name):
+    """Return the installed version of a package, or "0.0.0" if not installed."""
+    # Memoized: the lookup scans every dist-info directory on sys.path.
+    try:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        logger.warning("Package '%s' not found in installed packages.", package_name)
+        return "0.0.0"
+
+
+@functools.cache
+def _get_checker(package_name):
+    """
+    Return the process-wide UpdateChecker for a package.
+
+    Repeated checks in one process reuse the installed-version lookup, data
+    directory setup and loaded update data instead of redoing them per call.
+    """
+    return UpdateChecker(package_name)
+
+
 class UpdateChecker:
     """
     A class to check for updates to any Python package.
@@ -62,11 +109,7 @@ class UpdateChecker:
         self.repo = repo
 
         # Get the current version
-        try:
-            self.current_version = importlib.metadata.version(package_name)
-        except importlib.metadata.PackageNotFoundError:
-            logger.warning(f"Package '{package_name}' not found in installed packages.")
-            self.current_version = "0.0.0"
+        self.current_version = _installed_version(package_name)
 
         self.check_interval = check_interval
 
@@ -90,10 +133,8 @@ class UpdateChecker:
 
             self.data_dir.mkdir(exist_ok=True, parents=True)
         except (PermissionError, OSError) as e:
-            logger.warning(f"Could not create data directory {self.data_dir}: {e}")
+            logger.warning("Could not create data directory %s: %s", self.data_dir, e)
             # Fall back to a temporary directory
-            import tempfile
-
             self.data_dir = Path(tempfile.gettempdir()) / package_name
             try:
                 self.data_dir.mkdir(exist_ok=True, parents=True)
@@ -101,7 +142,9 @@ class UpdateChecker:
                 # Even the temp dir is unwritable; degrade to in-memory-only
                 # rather than crashing the caller's constructor.
                 logger.warning(
-                    f"Could not create fallback data directory {self.data_dir}: {tmp_err}"
+                    "Could not create fallback data directory %s: %s",
+                    self.data_dir,
+                    tmp_err,
                 )
                 self.data_dir = None
 
@@ -110,8 +153,13 @@ class UpdateChecker:
         # Whether the most recent fetch succeeded; gates last_check advancement.
         self._last_fetch_ok = True
 
-        # Load existing data
-        self.update_data = self._load_update_data()
+        # Thread running a check started by check_for_updates_in_background().
+        self._background_thread = None
+
+    @functools.cached_property
+    def update_data(self):
+        """Data recorded by previous checks, loaded from disk on first use."""
+        return self._load_update_data()
 
     def _load_update_data(self):
         """Load update data from the local file."""
@@ -134,9 +182,9 @@ class UpdateChecker:
                             data["last_check"] = None
                     return data
         except (json.JSONDecodeError, ValueError) as e:
-            logger.debug(f"Error loading update data: {e}")
+            logger.debug("Error loading update data: %s", e)
         except UnicodeDecodeError as e:
-            logger.debug(f"Encoding error reading update data: {e}")
+            logger.debug("Encoding error reading update data: %s", e)
 
         # Return default data if file doesn't exist or has errors
         return {
@@ -156,21 +204,73 @@ class UpdateChecker:
             if save_data.get("last_check"):
                 save_data["last_check"] = save_data["last_check"].isoformat()
 
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, indent=4, ensure_ascii=False)
+            # Serialize up front (an unserializable value then never touches
+            # the disk), write a uniquely named sibling file, and rename it
+            # into place. A process exiting mid-write never leaves a truncated
+            # update.json behind, and concurrent savers (a background check,
+            # another process) never write into the same temporary file.
+            text = json.dumps(save_data, indent=4, ensure_ascii=False)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.data_file.parent,
+                prefix=self.data_file.name + ".",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_name, self.data_file)
+            except OSError:
+                os.unlink(tmp_name)
+                raise
         except Exception as e:
-            logger.debug(f"Error saving update data: {e}")
+            logger.debug("Error saving update data: %s", e)
 
-    def check_for_updates(self, force=False):
+    def check_for_updates(self, force=False, session=None):
         """
         Check for updates to the package.
 
         Args:
             force (bool): Force an update check even if the interval hasn't elapsed.
+            session (requests.Session): Session to fetch with; defaults to the
+                shared process-wide session.
 
         Returns:
             dict: Update status containing current_version, latest_version, and update_available.
         """
+        if self._check_due(force):
+            self._refresh(session)
+
+        # Return update status
+        return self.get_update_status()
+
+    def check_for_updates_in_background(self, force=False):
+        """
+        Start an update check without waiting for the network.
+
+        If a check is due, it runs in a daemon thread and its result is saved
+        for the next invocation; the status returned here comes from the data
+        recorded by earlier checks, so the caller is never blocked.
+
+        Args:
+            force (bool): Force an update check even if the interval hasn't elapsed.
+
+        Returns:
+            dict: Update status from previously recorded data.
+        """
+        import threading  # pylint: disable=import-outside-toplevel
+
+        status = self.get_update_status()
+        if self._check_due(force):
+            self._background_thread = threading.Thread(
+                target=self._refresh_in_background,
+                name=f"update-check-{self.package_name}",
+                daemon=True,
+            )
+            self._background_thread.start()
+        return status
+
+    def _check_due(self, force=False):
+        """Return True if an update check should be performed now."""
         last_check = self.update_data.get("last_check")
 
         # Check if we need to perform an update check
@@ -185,44 +285,76 @@ class UpdateChecker:
             # If last_check exists but isn't a datetime, force a check
             need_check = True
 
-        if need_check:
-            latest_version = self._fetch_latest_version()
+        return need_check
 
-            # Update the data
-            self.update_data["latest_version"] = latest_version
-            self.update_data["current_version"] = self.current_version
-            # Only advance last_check on a successful fetch, so a transient
-            # network/parse failure doesn't suppress retries for the whole
-            # check interval.
-            if self._last_fetch_ok:
-                self.update_data["last_check"] = datetime.now()
+    def _refresh_in_background(self):
+        """Run _refresh() on a session owned by the background thread."""
+        import requests  # pylint: disable=import-outside-toplevel
 
-            # Save the updated data
-            self._save_update_data()
+        # The shared session is closed at interpreter exit, which can happen
+        # while this daemon thread is still mid-request; don't borrow it.
+        with requests.Session() as session:
+            self._refresh(session)
 
-        # Return update status
-        return self.get_update_status()
+    def _refresh(self, session=None):
+        """Fetch the latest version, record it, and save the update data."""
+        latest_version = self._fetch_latest_version(session)
+
+        # Update the data
+        self.update_data["latest_version"] = latest_version
+        self.update_data["current_version"] = self.current_version
+        # Only advance last_check on a successful fetch, so a transient
+        # network/parse failure doesn't suppress retries for the whole
+        # check interval.
+        if self._last_fetch_ok:
+            self.update_data["last_check"] = datetime.now()
+
+        # Save the updated data
+        self._save_update_data()
+
+    def _fetch_latest_version(self, session=None):
+        """Fetch the latest version, on ``session`` or the shared one."""
+        import requests  # pylint: disable=import-outside-toplevel
 
-    def _fetch_latest_version(self):
-        """Fetch the latest version from the configured source."""
         self._last_fetch_ok = True
+        cached_version = self.update_data.get("latest_version")
+
+        # Revalidate instead of re-downloading: with the validators from the
+        # last response, an unchanged release costs a header-only 304 (which
+        # GitHub also doesn't count against the API rate limit).
+        headers = {}
+        if cached_version:
+            if self.update_data.get("etag"):
+                headers["If-None-Match"] = self.update_data["etag"]
+            if self.update_data.get("last_modified"):
+                headers["If-Modified-Since"] = self.update_data["last_modified"]
+
         try:
-            response = requests.get(self.update_url, timeout=5)
+            session = session or _http_session()
+            response = session.get(self.update_url, timeout=5, headers=headers)
+            if response.status_code == 304 and headers:
+                return cached_version
             response.raise_for_status()
 
             if self.source == "github":
                 data = response.json()
-                return data.get("tag_name", "0.0.0").lstrip("v")
+                latest_version = data.get("tag_name", "0.0.0").lstrip("v")
             else:  # PyPI
                 data = response.json()
-                return data.get("info", {}).get("version", "0.0.0")
+                latest_version = data.get("info", {}).get("version", "0.0.0")
+
+            # Record the validators only once the body has been understood;
+            # otherwise the next 304 would vouch for a stale cached version.
+            self.update_data["etag"] = response.headers.get("ETag")
+            self.update_data["last_modified"] = response.headers.get("Last-Modified")
+            return latest_version
 
         except requests.RequestException as e:
-            logger.debug(f"Error checking for updates: {e}")
+            logger.debug("Error checking for updates: %s", e)
             self._last_fetch_ok = False
             return self.update_data.get("latest_version") or self.current_version
         except (json.JSONDecodeError, KeyError) as e:
-            logger.debug(f"Error parsing update response: {e}")
+            logger.debug("Error parsing update response: %s", e)
             self._last_fetch_ok = False
             return self.update_data.get("latest_version") or self.current_version
 
@@ -233,16 +365,20 @@ class UpdateChecker:
         Returns:
             dict: Update status containing current_version, latest_version, and update_available.
         """
+        from packaging.version import (  # pylint: disable=import-outside-toplevel
+            InvalidVersion,
+        )
+
         latest_version = self.update_data.get("latest_version") or "0.0.0"
         # A remote (e.g. GitHub tag) or hand-edited version may not be PEP 440
         # compliant; treat an unparseable version as "no update available"
         # rather than crashing the caller's CLI.
         try:
-            current = parse_version(self.current_version)
-            latest = parse_version(latest_version)
+            current = _parse_version(self.current_version)
+            latest = _parse_version(latest_version)
             update_available = latest > current
         except InvalidVersion as e:
-            logger.debug(f"Could not compare versions: {e}")
+            logger.debug("Could not compare versions: %s", e)
             update_available = False
 
         return {
@@ -266,21 +402,23 @@ class UpdateChecker:
         status = self.get_update_status()
 
         if status["update_available"]:
-            logger.info(f"Update available for {self.package_name}:")
-            logger.info(f"  Current version: {status['current_version']}")
-            logger.info(f"  Latest version: {status['latest_version']}")
-            logger.info(f"  Update with: pip install -U {self.package_name}")
+            logger.info("Update available for %s:", self.package_name)
+            logger.info("  Current version: %s", status["current_version"])
+            logger.info("  Latest version: %s", status["latest_version"])
+            logger.info("  Update with: pip install -U %s", self.package_name)
             return True
         elif not quiet:
             logger.info(
-                f"{self.package_name} is up to date ({status['current_version']})."
+                "%s is up to date (%s).", self.package_name, status["current_version"]
             )
 
         return False
 
 
 # Convenience function for quick checks
-def check_package_for_updates(package_name, notify=True, force=False, quiet=True):
+def check_package_for_updates(
+    package_name, notify=True, force=False, quiet=True, background=False
+):
     """
     Check a package for updates.
 
@@ -289,12 +427,17 @@ def check_package_for_updates(package_name, notify=True, force=False, quiet=True
         notify (bool): Whether to print a notification
         force (bool): Whether to force a check regardless of interval
         quiet (bool): Don't print anything if no update is available
+        background (bool): Don't wait for the network; report the status
+            recorded by earlier checks and refresh it in a background thread
 
     Returns:
         dict: Update status
     """
-    checker = UpdateChecker(package_name)
-    status = checker.check_for_updates(force=force)
+    checker = _get_checker(package_name)
+    if background:
+        status = checker.check_for_updates_in_background(force=force)
+    else:
+        status = checker.check_for_updates(force=force)
 
     if notify:
         checker.notify_if_update_available(quiet=quiet)
@@ -302,6 +445,65 @@ def check_package_for_updates(package_name, notify=True, force=False, quiet=True
     return status
 
 
+def check_packages_for_updates(
+    package_names, notify=True, force=False, quiet=True, max_workers=8
+):
+    """
+    Check several packages for updates concurrently.
+
+    The HTTP requests run in a thread pool, so checking N packages costs
+    roughly one round trip instead of N. requests.Session is not documented
+    as thread-safe, so each worker thread uses a session of its own.
+    Notifications, if enabled, are printed afterwards in the given order.
+
+    Args:
+        package_names (list): The names of the packages to check
+        notify (bool): Whether to print a notification for each package
+        force (bool): Whether to force checks regardless of interval
+        quiet (bool): Don't print anything for packages that are up to date
+        max_workers (int): Maximum number of concurrent checks (at least 1)
+
+    Returns:
+        dict: Update status per package name
+    """
+    # Duplicate names would share one checker; check each package once.
+    checkers = [_get_checker(name) for name in dict.fromkeys(package_names)]
+    if not checkers:
+        return {}
+
+    # Like requests, the threading machinery is only imported when used.
+    import threading  # pylint: disable=import-outside-toplevel
+    from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+        ThreadPoolExecutor,
+    )
+
+    import requests  # pylint: disable=import-outside-toplevel
+
+    local = threading.local()
+    sessions = []
+
+    def check(checker):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+            sessions.append(session)
+        return checker.check_for_updates(force=force, session=session)
+
+    workers = max(1, min(max_workers, len(checkers)))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            statuses = list(pool.map(check, checkers))
+    finally:
+        for session in sessions:
+            session.close()
+
+    if notify:
+        for checker in checkers:
+            checker.notify_if_update_available(quiet=quiet)
+
+    return {checker.package_name: status for checker, status in zip(checkers, statuses)}
+
+
 # Example usage
 if __name__ == "__main__":
     # Check for updates to this package
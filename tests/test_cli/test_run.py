@@ -84,6 +84,47 @@ class TestDiscovery:
         assert cli._discover_actions(str(command_dir)) == ["create", "show"]
 
 
+class TestDirectTarget:
+    """The fast path that builds only the requested command/action branch."""
+
+    def _commands_dir(self, fake_pkg):
+        pkg = importlib.import_module(fake_pkg)
+        return os.path.join(os.path.dirname(pkg.__file__), "commands")
+
+    def test_plain_invocation_is_targeted(self, fake_pkg):
+        commands_dir = self._commands_dir(fake_pkg)
+        argv = ["--verbose", "greet", "hello", "--name", "x"]
+        assert cli._direct_target(argv, commands_dir) == ("greet", "hello")
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["greet"],
+            ["-h", "greet", "hello"],
+            ["greet", "--help"],
+            ["greet", "nope"],
+            ["nope", "hello"],
+            ["greet", "__init__"],
+        ],
+    )
+    def test_falls_back_to_full_tree(self, fake_pkg, argv):
+        assert cli._direct_target(argv, self._commands_dir(fake_pkg)) is None
+
+    def test_completion_uses_full_tree(self, fake_pkg, monkeypatch):
+        monkeypatch.setenv("_ARGCOMPLETE", "1")
+        commands_dir = self._commands_dir(fake_pkg)
+        assert cli._direct_target(["greet", "hello"], commands_dir) is None
+
+    def test_sibling_actions_not_imported(self, fake_pkg, tmp_path, monkeypatch):
+        (tmp_path / "fakecli" / "commands" / "greet" / "other.py").write_text(
+            "class GreetOther:\n    pass\n"
+        )
+        monkeypatch.setattr(sys, "argv", ["fakecli", "greet", "hello"])
+        assert cli.run(package=fake_pkg, prog="fakecli") == 0
+        assert "fakecli.commands.greet.other" not in sys.modules
+
+
 class TestRun:
     """End-to-end dispatch through the runner."""
 
@@ -122,6 +163,26 @@ class TestRun:
 
         assert GreetHello.state.get("verbose") is False
 
+    def test_parser_reused_across_runs(self, fake_pkg, monkeypatch):
+        builds = []
+        real_build = cli._build_parser
+
+        def counting_build(*args, **kwargs):
+            builds.append(args)
+            return real_build(*args, **kwargs)
+
+        monkeypatch.setattr(cli, "_build_parser", counting_build)
+        monkeypatch.setattr(sys, "argv", ["fakecli", "greet", "hello", "--name", "a"])
+        assert cli.run(package=fake_pkg, prog="fakecli") == 0
+        monkeypatch.setattr(sys, "argv", ["fakecli", "greet", "hello", "--name", "b"])
+        assert cli.run(package=fake_pkg, prog="fakecli") == 0
+        from fakecli.commands.greet.hello import GreetHello
+
+        assert GreetHello.state.get("name") == "b"
+        assert len(builds) == 1
+        # Each cached parser pins its action classes; the cache must be bounded.
+        assert cli._cached_parser.cache_info().maxsize is not None
+
 
 class TestActionSetupIsolation:
     """A broken action module is logged and skipped, not fatal to the CLI."""
@@ -77,6 +77,19 @@ class TestCommand:
         cmd = LeveledCmd(log_level=logging.DEBUG)
         assert cmd.log.level == logging.DEBUG
 
+    def test_logger_resolved_once_per_class(self):
+        """Instances of a command class share the class-level logger."""
+
+        class SharedCmd(Command):
+            def define_arguments(self, parser):
+                return parser
+
+            def execute(self, args):
+                return 0
+
+        assert SharedCmd().log is SharedCmd().log
+        assert SharedCmd.log.name.endswith(".SharedCmd")
+
     def test_define_common_arguments(self, mock_parser):
         """Test that common arguments are added to parser."""
         Command.define_common_arguments(mock_parser)
@@ -7,7 +7,9 @@ exposure, deep merging, default-config discovery, and schema validation.
 """
 
 import builtins
+import os
 import sys
+import tempfile
 import textwrap
 
 import pytest
@@ -74,6 +76,16 @@ class TestAttributeExposure:
         # A non-colliding key is exposed as an attribute.
         assert config.server == "y"
 
+    def test_attribute_reads_live_config(self, monkeypatch):
+        monkeypatch.setattr(Config, "load", lambda self, module_name: {"server": "y"})
+        monkeypatch.setattr(Config, "_load_env_vars", lambda self: None)
+        config = Config("testexpose")
+
+        config.set("server", "z")
+        assert config.server == "z"
+        with pytest.raises(AttributeError):
+            _ = config.missing
+
 
 class TestDeepMerge:
     """_deep_merge merges nested dicts key-by-key (config.py)."""
@@ -86,6 +98,12 @@ class TestDeepMerge:
         # Input dicts are not mutated.
         assert base == {"a": {"x": 1, "y": 2}, "b": 5}
 
+    def test_deeply_nested_override(self):
+        base = {"a": {"b": {"c": 1, "d": 2}}}
+        merged = Config._deep_merge(base, {"a": {"b": {"d": 3}}})
+        assert merged == {"a": {"b": {"c": 1, "d": 3}}}
+        assert base == {"a": {"b": {"c": 1, "d": 2}}}
+
     def test_scalar_replaces_dict(self):
         merged = Config._deep_merge({"a": {"x": 1}}, {"a": 7})
         assert merged == {"a": 7}
@@ -117,6 +135,162 @@ class TestDefaultConfig:
         finally:
             sys.modules.pop("tmpcfgmod", None)
 
+    def test_default_config_cache_is_not_mutated(self, tmp_path, monkeypatch):
+        pkg = tmp_path / "tmpcachemod"
+        (pkg / "config").mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "config" / "tmpcachemod.yaml").write_text("server:\n  port: 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        sys.modules.pop("tmpcachemod", None)
+        import tmpcachemod  # noqa: F401  (import needed so Config can find __file__)
+
+        try:
+            first = Config("tmpcachemod")
+            first.set("server.port", 99)
+            second = Config("tmpcachemod")
+            assert second.get("server.port") == 1
+        finally:
+            sys.modules.pop("tmpcachemod", None)
+
+    def test_missing_default_config_is_silent(self, tmp_path, caplog):
+        from cac_core.config import _read_default_config
+
+        missing = str(tmp_path / "config" / "nomod.yaml")
+        assert _read_default_config(missing) == {}
+        assert "Failed to load default config" not in caplog.text
+
+
+class TestUserConfigCache:
+    """Repeated loads of an unchanged user config reuse the parsed result."""
+
+    def test_reload_sees_rewritten_file(self, isolated_home):
+        config = Config("testusercache")
+        config_path = isolated_home / ".config" / "testusercache" / "config.yaml"
+        config_path.write_text("level: 1\n")
+        assert config.load("testusercache")["level"] == 1
+
+        config_path.write_text("level: 22\n")
+        assert config.load("testusercache")["level"] == 22
+
+    def test_cached_result_is_not_shared(self, isolated_home):
+        config = Config("testusercache")
+        config_path = isolated_home / ".config" / "testusercache" / "config.yaml"
+        config_path.write_text("server:\n  port: 1\n")
+        first = config.load("testusercache")
+        first["server"]["port"] = 99
+        assert config.load("testusercache")["server"]["port"] == 1
+
+
+class TestFromDict:
+    """Config.from_dict builds an instance without touching disk or env."""
+
+    def test_no_io_and_no_env(self, isolated_home, monkeypatch):
+        monkeypatch.setenv("TESTFROMDICT_SERVER", "from-env")
+        config = Config.from_dict("testfromdict", {"server": "x", "api": {"port": 1}})
+
+        assert config.server == "x"
+        assert config.get("api.port") == 1
+        assert config.env_prefix == "TESTFROMDICT"
+        assert config.config_file.endswith("config.yaml")
+        assert not (isolated_home / ".config" / "testfromdict").exists()
+
+
+class TestLoadErrors:
+    """Unreadable user config degrades to defaults instead of raising."""
+
+    def test_non_mapping_user_config_is_ignored(self, isolated_home):
+        config_dir = isolated_home / ".config" / "testbadshape"
+        config_dir.mkdir(parents=True)
+        (config_dir / "config.yaml").write_text("- just\n- a list\n")
+        config = Config("testbadshape")
+        assert config.get("config_file_path") == str(config_dir / "config.yaml")
+
+    def test_unexpected_errors_are_not_swallowed(self, isolated_home, monkeypatch):
+        config = Config("testunexpected")
+
+        def _bug(_path):
+            raise RuntimeError("bug")
+
+        monkeypatch.setattr("cac_core.config._read_user_config", _bug)
+        with pytest.raises(RuntimeError):
+            config.load("testunexpected")
+
+
+class TestSave:
+    """save() writes atomically and skips rewriting identical content."""
+
+    def test_unchanged_save_does_not_rewrite(self, isolated_home):
+        config = Config("testsave")
+        config.set("server", "a")
+        assert config.save() is True
+        config_path = isolated_home / ".config" / "testsave" / "config.yaml"
+        inode = config_path.stat().st_ino
+
+        assert config.save() is True
+        assert config_path.stat().st_ino == inode
+
+    def test_changed_save_replaces_file(self, isolated_home):
+        config = Config("testsave")
+        config.set("server", "a")
+        config.save()
+        config.set("server", "b")
+        assert config.save() is True
+
+        config_dir = isolated_home / ".config" / "testsave"
+        assert "server: b" in (config_dir / "config.yaml").read_text()
+        assert [p.name for p in config_dir.iterdir()] == ["config.yaml"]
+
+    def test_each_save_uses_its_own_temp_file(self, isolated_home, monkeypatch):
+        created = []
+        real_mkstemp = tempfile.mkstemp
+
+        def _mkstemp(**kwargs):
+            fd, name = real_mkstemp(**kwargs)
+            created.append(name)
+            return fd, name
+
+        monkeypatch.setattr("cac_core.config.tempfile.mkstemp", _mkstemp)
+        config = Config("testsave")
+        config.set("server", "a")
+        config.save()
+        config.set("server", "b")
+        config.save()
+
+        config_dir = isolated_home / ".config" / "testsave"
+        # Config() itself writes the file on first run, then two saves.
+        assert len(set(created)) == len(created) == 3
+        assert all(os.path.dirname(name) == str(config_dir) for name in created)
+
+    def test_save_keeps_symlink_and_mode(self, isolated_home):
+        config = Config("testsave")
+        config_dir = isolated_home / ".config" / "testsave"
+        dotfiles = isolated_home / "dotfiles"
+        dotfiles.mkdir()
+        target = dotfiles / "config.yaml"
+        target.write_text("server: a\n")
+        target.chmod(0o644)
+        link = config_dir / "config.yaml"
+        link.unlink()
+        link.symlink_to(target)
+
+        config.set("server", "b")
+        assert config.save() is True
+
+        assert link.is_symlink()
+        assert "server: b" in target.read_text()
+        assert target.stat().st_mode & 0o777 == 0o644
+        assert [p.name for p in dotfiles.iterdir()] == ["config.yaml"]
+
+    def test_unrepresentable_value_returns_false(self, isolated_home):
+        config = Config("testsave")
+        config.set("server", "a")
+        config.save()
+        config.set("path", isolated_home)  # a pathlib.Path, not safe-dumpable
+        assert config.save() is False
+
+        config_dir = isolated_home / ".config" / "testsave"
+        assert (config_dir / "config.yaml").read_text() == "server: a\n"
+
 
 class TestContextManager:
     """Config supports use as a context manager."""
@@ -40,6 +40,23 @@ class TestCredentialManager:
         assert credential_manager.username == "test_user"
         assert credential_manager.credential == "test_password"
 
+    @patch("keyring.delete_password")
+    @patch("keyring.get_password")
+    def test_get_credential_cached(
+        self, mock_get_password, mock_delete_password, credential_manager
+    ):
+        """Repeated lookups are served from memory until the credential changes."""
+        mock_get_password.return_value = "test_password"
+
+        assert credential_manager.get_credential("test_user") == "test_password"
+        assert credential_manager.get_credential("test_user") == "test_password"
+        mock_get_password.assert_called_once_with("test_module", "test_user")
+
+        credential_manager.delete_credential("test_user")
+        mock_get_password.return_value = None
+        assert credential_manager.get_credential("test_user", prompt=False) is None
+        assert mock_get_password.call_count == 2
+
     @patch("keyring.get_password")
     @patch("getpass.getpass")
     @patch("keyring.set_password")
@@ -132,3 +149,31 @@ class TestCredentialManager:
         mock_delete_password.assert_called_once_with("test_module", "test_user")
         assert "Failed to delete" in caplog.text
         assert result is False
+
+    @patch("keyring.get_keyring")
+    def test_set_credentials_reuses_backend(self, mock_get_keyring, credential_manager):
+        """Bulk storage resolves the backend once and writes each credential."""
+        backend = mock_get_keyring.return_value
+
+        result = credential_manager.set_credentials({"alice": "a1", "bob": "b2"})
+
+        mock_get_keyring.assert_called_once_with()
+        backend.set_password.assert_any_call("test_module", "alice", "a1")
+        backend.set_password.assert_any_call("test_module", "bob", "b2")
+        assert backend.set_password.call_count == 2
+        assert result is True
+
+    @patch("keyring.get_keyring")
+    def test_set_credentials_partial_failure(
+        self, mock_get_keyring, credential_manager, caplog
+    ):
+        """One failed write is logged and the remaining credentials are stored."""
+        backend = mock_get_keyring.return_value
+        backend.set_password.side_effect = [Exception("Storage error"), None]
+
+        with caplog.at_level(logging.ERROR):
+            result = credential_manager.set_credentials({"alice": "a1", "bob": "b2"})
+
+        assert backend.set_password.call_count == 2
+        assert "Failed to store credential for alice" in caplog.text
+        assert result is False
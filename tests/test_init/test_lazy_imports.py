@@ -0,0 +1,41 @@
+"""
+Tests for lazy submodule loading in the cac_core package.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import cac_core
+
+
+def test_submodules_not_imported_eagerly():
+    """Importing the package alone should not import its submodules."""
+    code = (
+        "import sys, cac_core; "
+        "print(any(m in sys.modules for m in "
+        "('cac_core.config', 'cac_core.updatechecker', 'cac_core.output')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_attribute_access_loads_submodule():
+    """Accessing a submodule attribute imports and caches it."""
+    module = cac_core.model
+    assert module is sys.modules["cac_core.model"]
+    assert "model" in vars(cac_core)
+
+
+def test_unknown_attribute_raises():
+    """Unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = cac_core.does_not_exist
+
+
+def test_dir_lists_submodules():
+    """dir() advertises the lazily-loaded submodules."""
+    assert set(cac_core.__all__) <= set(dir(cac_core))
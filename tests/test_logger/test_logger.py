@@ -85,3 +85,11 @@ class TestLogger:
         # Should still be the same logger instance with no duplicate handlers
         assert logger1 is logger2
         assert len(logger2.handlers) == 1
+
+    def test_default_formatters_shared(self):
+        """Loggers using a default layout share one prebuilt Formatter."""
+        logger1 = cac.logger.new("test_shared_fmt_a", level=logging.INFO)
+        logger2 = cac.logger.new("test_shared_fmt_b", level=logging.INFO)
+        assert logger1.handlers[0].formatter is logger2.handlers[0].formatter
+        # Each logger keeps its own handler, so formats stay per-logger.
+        assert logger1.handlers[0] is not logger2.handlers[0]
@@ -34,6 +34,56 @@ class TestModel:
         # Check that internal data is updated
         assert model.data["name"] == "Updated Project"
 
+    def test_attribute_assignment_updates_data(self, sample_data):
+        """Assigning a known field as an attribute writes through to data."""
+        model = cac.model.Model(sample_data)
+
+        model.name = "Renamed"
+        assert model["name"] == "Renamed"
+        assert model.to_dict()["name"] == "Renamed"
+        assert model.data["name"] == "Renamed"
+
+    def test_unknown_attribute_assignment_never_adds_a_field(self):
+        """Assigning an unknown name never creates a field, on any class."""
+        model = cac.model.Model({"id": 1})
+        with pytest.raises(AttributeError):
+            model.extra = "x"
+        assert model.to_dict() == {"id": 1}
+
+        class Row(cac.model.Model):
+            pass
+
+        row = Row({"id": 1})
+        row.extra = "x"
+        assert row.extra == "x"
+        assert "extra" not in row
+        assert row.to_dict() == {"id": 1}
+
+    def test_plain_model_has_no_instance_dict(self, sample_data):
+        """Model uses __slots__; subclasses may still carry their own attributes."""
+        model = cac.model.Model(sample_data)
+        assert not hasattr(model, "__dict__")
+
+        class Row(cac.model.Model):
+            def __init__(self, data):
+                self.source = "api"
+                super().__init__(data)
+
+        row = Row({"id": 1})
+        assert row.source == "api"
+        assert row.to_dict() == {"id": 1}
+
+    def test_add_key_override_is_called(self):
+        """A subclass overriding add_key sees every kept key in order."""
+        seen = []
+
+        class Tracked(cac.model.Model):
+            def add_key(self, key, value):
+                seen.append(key)
+
+        Tracked({"a": 1, "secret": 2, "b": 3}, keys_to_remove=["secret"])
+        assert seen == ["a", "b"]
+
     def test_model_dict_methods(self, sample_data):
         """Test dictionary-like methods."""
         model = cac.model.Model(sample_data)
@@ -95,6 +145,62 @@ class TestModel:
         model.metadata["version"] = "2.0"
         assert model.metadata.version == "2.0"
 
+    def test_deeply_nested_model(self):
+        """Nesting deeper than the recursion limit still builds, with removals."""
+        data = {"level": 0, "secret": "x"}
+        row = data
+        for level in range(1, 5000):
+            row["child"] = {"level": level, "secret": "x", "items": [{"id": level}]}
+            row = row["child"]
+
+        node = cac.model.Model(data, keys_to_remove=["secret"])
+        for level in range(5000):
+            assert node.level == level
+            assert "secret" not in node
+            if level:
+                assert node["items"][0].id == level
+            node = node.get("child")
+        assert node is None
+
+    def test_cyclic_row_data_rejected(self):
+        """A dict that contains itself raises instead of building forever."""
+        data = {"a": 1}
+        data["self"] = data
+        with pytest.raises(ValueError):
+            cac.model.Model(data)
+
+        data = {"a": 1}
+        data["items"] = [{"parent": data}]
+        with pytest.raises(ValueError):
+            cac.model.Model(data)
+
+        shared = {"id": 1}
+        model = cac.model.Model({"a": shared, "b": [shared]})
+        assert model.to_dict() == {"a": {"id": 1}, "b": [{"id": 1}]}
+
+    def test_to_dict_deep_shared_and_cyclic(self):
+        """to_dict handles deep trees and shared children, and rejects cycles."""
+        data = {"level": 0}
+        row = data
+        for level in range(1, 5000):
+            row["child"] = {"level": level, "items": [level, {"id": level}]}
+            row = row["child"]
+        node = cac.model.Model(data).to_dict()
+        for level in range(1, 5000):
+            node = node["child"]
+            assert type(node) is dict
+            assert node["items"] == [level, {"id": level}]
+
+        shared = cac.model.Model({"id": 1})
+        parent = cac.model.Model({"a": None, "b": None})
+        parent["a"] = shared
+        parent["b"] = [shared]
+        assert parent.to_dict() == {"a": {"id": 1}, "b": [{"id": 1}]}
+
+        shared["parent"] = parent
+        with pytest.raises(ValueError):
+            parent.to_dict()
+
     def test_setitem_existing_key(self, sample_data):
         """Test __setitem__ updates existing keys."""
         model = cac.model.Model(sample_data)
@@ -182,6 +288,20 @@ class TestModel:
         assert result["name"] == "Test Project"
         assert result["metadata"]["version"] == "1.0"
 
+    def test_to_json_matches_to_dict(self):
+        """to_json serializes nested models as to_dict would, honoring overrides."""
+        import json
+
+        data = {"id": 1, "meta": {"tags": [{"n": "a"}, "b"]}}
+        model = cac.model.Model(data)
+        assert json.loads(model.to_json()) == model.to_dict() == data
+
+        class Summary(cac.model.Model):
+            def to_dict(self):
+                return {"id": self.id}
+
+        assert json.loads(Summary(data).to_json()) == {"id": 1}
+
     def test_repr(self, sample_data):
         """Test __repr__ output."""
         model = cac.model.Model(sample_data)
@@ -202,6 +322,15 @@ class TestModel:
         assert "name" in model
         assert "secret" not in model
 
+    def test_equality_is_identity(self):
+        """Models compare and hash by identity, so they work in sets and as keys."""
+        m1 = cac.model.Model({"name": "a"})
+        m2 = cac.model.Model({"name": "a"})
+        assert m1 != m2
+        assert len({m1, m2}) == 2
+        assert {m1: "first"}[m1] == "first"
+        assert [m2, m1].index(m1) == 1
+
     def test_no_cross_instance_pollution(self):
         """Test that separate Model instances don't share field data."""
         m1 = cac.model.Model({"name": "first", "color": "red"})
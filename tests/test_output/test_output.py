@@ -43,6 +43,26 @@ class TestOutput:
         assert parsed_json[0]["name"] == "Test Project"
         assert parsed_json[1]["name"] == "Second Project"
 
+    def test_json_output_duck_typed_to_dict(self, sample_models):
+        """Non-Model items providing to_dict() serialize as they do in tables."""
+
+        class Record:
+            def to_dict(self):
+                return {"name": "Duck", "nested": sample_models[1]}
+
+        output = cac.output.Output({"output": "json"})
+
+        f = StringIO()
+        with redirect_stdout(f):
+            output.print_models([sample_models[0], Record()])
+
+        parsed_json = json.loads(f.getvalue())
+        assert parsed_json[0]["name"] == "Test Project"
+        assert parsed_json[1] == {
+            "name": "Duck",
+            "nested": {"name": "Second Project", "key": "SEC", "status": "inactive"},
+        }
+
     def test_table_output(self, sample_models):
         """Test table output format."""
         output = cac.output.Output({"output": "table"})
@@ -139,3 +159,45 @@ class TestOutput:
         out = f.getvalue()
         assert "a, b" in out
         assert "version" in out
+
+    def test_table_flattens_mixed_lists(self):
+        """List cells render each element by its own type."""
+        model = cac.model.Model({"owners": [{"id": 1}, "bob", 3]})
+        output = cac.output.Output({"output": "table"})
+
+        f = StringIO()
+        with redirect_stdout(f):
+            output.print_models([model])
+
+        assert '{"id": 1}, bob, 3' in f.getvalue()
+
+    def test_table_flattens_instance_to_dict(self):
+        """Cells with a per-instance or __getattr__-provided to_dict() are flattened."""
+
+        class Proxy:
+            def __getattr__(self, name):
+                if name == "to_dict":
+                    return lambda: {"via": "getattr"}
+                raise AttributeError(name)
+
+        record = type("Record", (), {})()
+        record.to_dict = lambda: {"via": "instance"}
+        model = cac.model.Model({"a": None, "b": None})
+        model["a"] = Proxy()
+        model["b"] = [record]
+        output = cac.output.Output({"output": "table"})
+
+        f = StringIO()
+        with redirect_stdout(f):
+            output.print_models([model])
+
+        out = f.getvalue()
+        assert '{"via": "getattr"}' in out
+        assert '{"via": "instance"}' in out
+
+    def test_logger_created_on_first_use(self):
+        """Constructing an Output does not configure its logger until it is used."""
+        output = cac.output.Output({"output": "json"})
+        assert output._logger is None
+        assert output.logger.name == "OutputTable"
+        assert output.logger is output.logger
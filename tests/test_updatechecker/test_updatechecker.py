@@ -17,7 +17,21 @@ import pytest
 import requests
 
 import cac_core.updatechecker as uc
-from cac_core.updatechecker import UpdateChecker, check_package_for_updates
+from cac_core.updatechecker import (
+    UpdateChecker,
+    check_package_for_updates,
+    check_packages_for_updates,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_checker_cache():
+    """Keep checkers (or mocks) and versions cached by one test out of the next."""
+    uc._get_checker.cache_clear()
+    uc._installed_version.cache_clear()
+    yield
+    uc._get_checker.cache_clear()
+    uc._installed_version.cache_clear()
 
 
 @pytest.fixture
@@ -185,16 +199,48 @@ class TestUpdateChecker:
             # Restore the mock
             mock_update_checker._save_update_data = mocked_method
 
+    def test_save_update_data_failed_replace_keeps_old_file(self, mock_update_checker):
+        """A failed save leaves the previous file intact and no temp file."""
+        data_file = mock_update_checker.data_file
+        data_file.write_text('{"latest_version": "1.0.0"}')
+        mock_update_checker.update_data = {"latest_version": "2.0.0"}
+
+        with patch("cac_core.updatechecker.os.replace", side_effect=OSError("boom")):
+            UpdateChecker._save_update_data(mock_update_checker)
+
+        assert json.loads(data_file.read_text()) == {"latest_version": "1.0.0"}
+        assert list(data_file.parent.iterdir()) == [data_file]
+
     def test_fetch_latest_version_pypi_success(self, mock_update_checker):
         """Test fetching the latest version from PyPI when successful."""
         mock_response = MagicMock()
         mock_response.json.return_value = {"info": {"version": "2.0.0"}}
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             version = mock_update_checker._fetch_latest_version()
-            mock_get.assert_called_once_with(mock_update_checker.update_url, timeout=5)
+            mock_get.assert_called_once_with(
+                mock_update_checker.update_url, timeout=5, headers={}
+            )
             assert version == "2.0.0"
 
+    def test_fetch_reuses_one_session(self, tmp_path, monkeypatch):
+        """Repeated fetches go through the same pooled HTTP session."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        with patch("importlib.metadata.version", return_value="1.0.0"):
+            checker = UpdateChecker("pkg-session")
+        mock_response = MagicMock(status_code=200, headers={})
+        mock_response.json.return_value = {"info": {"version": "2.0.0"}}
+
+        with patch(
+            "requests.Session.get", autospec=True, return_value=mock_response
+        ) as mock_get:
+            assert checker._fetch_latest_version() == "2.0.0"
+            assert checker._fetch_latest_version() == "2.0.0"
+
+        first, second = (call.args[0] for call in mock_get.call_args_list)
+        assert isinstance(first, requests.Session)
+        assert first is second
+
     def test_fetch_latest_version_github_success(self, mock_update_checker):
         """Test fetching the latest version from GitHub when successful."""
         mock_update_checker.source = "github"
@@ -206,11 +252,74 @@ class TestUpdateChecker:
         mock_response = MagicMock()
         mock_response.json.return_value = {"tag_name": "v2.0.0"}
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
             version = mock_update_checker._fetch_latest_version()
-            mock_get.assert_called_once_with(mock_update_checker.update_url, timeout=5)
+            mock_get.assert_called_once_with(
+                mock_update_checker.update_url, timeout=5, headers={}
+            )
             assert version == "2.0.0"
 
+    def test_fetch_latest_version_not_modified(self, mock_update_checker):
+        """A 304 for the stored validators keeps the cached version."""
+        mock_update_checker.update_data.update(
+            {
+                "latest_version": "1.5.0",
+                "etag": '"abc"',
+                "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+            }
+        )
+        mock_response = MagicMock(status_code=304)
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            version = mock_update_checker._fetch_latest_version()
+
+        mock_get.assert_called_once_with(
+            mock_update_checker.update_url,
+            timeout=5,
+            headers={
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+            },
+        )
+        mock_response.json.assert_not_called()
+        assert version == "1.5.0"
+        assert mock_update_checker._last_fetch_ok is True
+
+    def test_fetch_latest_version_stores_validators(self, mock_update_checker):
+        """A full response records its ETag/Last-Modified for the next check."""
+        mock_response = MagicMock(status_code=200)
+        mock_response.headers = {"ETag": '"v2"', "Last-Modified": "today"}
+        mock_response.json.return_value = {"info": {"version": "2.0.0"}}
+
+        with patch("requests.Session.get", return_value=mock_response):
+            assert mock_update_checker._fetch_latest_version() == "2.0.0"
+
+        assert mock_update_checker.update_data["etag"] == '"v2"'
+        assert mock_update_checker.update_data["last_modified"] == "today"
+
+    def test_fetch_latest_version_bad_body_keeps_validators(self, mock_update_checker):
+        """Validators of an unparseable 200 aren't used to revalidate later."""
+        mock_update_checker.update_data["latest_version"] = "1.5.0"
+        bad_response = MagicMock(status_code=200)
+        bad_response.headers = {"ETag": '"v2"', "Last-Modified": "today"}
+        bad_response.json.side_effect = json.JSONDecodeError("bad", "", 0)
+        not_modified = MagicMock(status_code=304, headers={})
+        not_modified.json.side_effect = json.JSONDecodeError("empty", "", 0)
+
+        with patch(
+            "requests.Session.get", side_effect=[bad_response, not_modified]
+        ) as mock_get:
+            assert mock_update_checker._fetch_latest_version() == "1.5.0"
+            assert mock_update_checker._last_fetch_ok is False
+            assert mock_update_checker.update_data.get("etag") is None
+            assert mock_update_checker.update_data.get("last_modified") is None
+
+            # No validators were recorded, so this is a plain (unconditional)
+            # request; the 304 then can't be taken as a successful check.
+            assert mock_update_checker._fetch_latest_version() == "1.5.0"
+            assert mock_get.call_args.kwargs["headers"] == {}
+            assert mock_update_checker._last_fetch_ok is False
+
     def test_fetch_latest_version_request_error(self, mock_update_checker):
         """Test handling of request errors."""
 
@@ -218,8 +327,8 @@ class TestUpdateChecker:
         def request_error(*args, **kwargs):
             raise requests.RequestException("Connection error")
 
-        # Patch requests.get to raise the RequestException
-        with patch("requests.get", side_effect=request_error):
+        # Patch the session's get to raise the RequestException
+        with patch("requests.Session.get", side_effect=request_error):
             # Previously stored version should be returned on error
             mock_update_checker.update_data["latest_version"] = "1.5.0"
             version = mock_update_checker._fetch_latest_version()
@@ -235,7 +344,7 @@ class TestUpdateChecker:
         mock_response = MagicMock()
         mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             # Should handle JSON errors gracefully
             version = mock_update_checker._fetch_latest_version()
             assert version == "1.0.0"
@@ -250,6 +359,58 @@ class TestUpdateChecker:
             assert status["latest_version"] == "2.0.0"
             assert status["update_available"] is True
 
+    def test_check_for_updates_in_background(self, mock_update_checker):
+        """A due check runs in a thread; the caller gets the recorded status."""
+        mock_update_checker.update_data["latest_version"] = "1.5.0"
+        with patch.object(
+            mock_update_checker, "_fetch_latest_version", return_value="2.0.0"
+        ):
+            status = mock_update_checker.check_for_updates_in_background(force=True)
+            mock_update_checker._background_thread.join(timeout=5)
+
+        assert status["latest_version"] == "1.5.0"
+        assert mock_update_checker.update_data["latest_version"] == "2.0.0"
+        with open(mock_update_checker.data_file, "r") as f:
+            assert json.load(f)["latest_version"] == "2.0.0"
+
+    def test_background_check_uses_its_own_session(self, mock_update_checker):
+        """The daemon thread never borrows the shared session closed at exit."""
+        mock_response = MagicMock(status_code=200, headers={})
+        mock_response.json.return_value = {"info": {"version": "2.0.0"}}
+        with (
+            patch("cac_core.updatechecker._http_session") as mock_shared,
+            patch("requests.Session.get", return_value=mock_response) as mock_get,
+        ):
+            mock_update_checker.check_for_updates_in_background(force=True)
+            mock_update_checker._background_thread.join(timeout=5)
+
+        mock_shared.assert_not_called()
+        mock_get.assert_called_once()
+        assert mock_update_checker.update_data["latest_version"] == "2.0.0"
+
+    def test_save_update_data_uses_unique_temp_files(self, mock_update_checker):
+        """Each save writes its own temporary file, never a shared fixed name."""
+        mock_update_checker.update_data = {"latest_version": "2.0.0"}
+        with patch(
+            "cac_core.updatechecker.tempfile.mkstemp", wraps=tempfile.mkstemp
+        ) as mock_mkstemp:
+            UpdateChecker._save_update_data(mock_update_checker)
+            UpdateChecker._save_update_data(mock_update_checker)
+
+        data_file = mock_update_checker.data_file
+        assert mock_mkstemp.call_count == 2
+        for call in mock_mkstemp.call_args_list:
+            assert call.kwargs["dir"] == data_file.parent
+        assert json.loads(data_file.read_text()) == {"latest_version": "2.0.0"}
+        assert list(data_file.parent.iterdir()) == [data_file]
+
+    def test_background_check_not_started_within_interval(self, mock_update_checker):
+        """No thread is started when the check interval hasn't elapsed."""
+        mock_update_checker.update_data["last_check"] = datetime.now()
+        status = mock_update_checker.check_for_updates_in_background()
+        assert mock_update_checker._background_thread is None
+        assert status["package_name"] == "test-package"
+
     def test_check_for_updates_within_interval(self, mock_update_checker):
         """Test update check respects interval."""
         real_datetime = datetime.now() - timedelta(hours=1)
@@ -395,6 +556,29 @@ class TestUpdateCheckerEdgeCases:
         assert checker.update_data["last_check"] is None
         assert checker.update_data["current_version"] == "1.0.0"
 
+    def test_update_data_loaded_on_first_use(self, tmp_path):
+        self._write_data_file(tmp_path, "pkg-lazy", '{"latest_version": "2.0.0"}')
+        with (
+            patch("importlib.metadata.version", return_value="1.0.0"),
+            patch.object(
+                UpdateChecker,
+                "_load_update_data",
+                autospec=True,
+                side_effect=UpdateChecker._load_update_data,
+            ) as mock_load,
+        ):
+            checker = UpdateChecker("pkg-lazy")
+            mock_load.assert_not_called()
+            assert checker.update_data["latest_version"] == "2.0.0"
+            assert checker.get_update_status()["update_available"] is True
+            mock_load.assert_called_once()
+
+    def test_installed_version_looked_up_once(self, tmp_path):
+        with patch("importlib.metadata.version", return_value="1.0.0") as mock_version:
+            assert UpdateChecker("pkg-once").current_version == "1.0.0"
+            assert UpdateChecker("pkg-once").current_version == "1.0.0"
+        mock_version.assert_called_once_with("pkg-once")
+
     def test_load_invalid_json_falls_back_to_default(self, tmp_path):
         self._write_data_file(tmp_path, "pkg-badjson", "{not valid json")
         with patch("importlib.metadata.version", return_value="1.0.0"):
@@ -530,6 +714,54 @@ def test_check_package_for_updates_convenience():
 
         mock_instance.notify_if_update_available.assert_called_once_with(quiet=False)
         assert result["update_available"] is True
+        # The checker built by the first call is reused.
+        MockUpdateChecker.assert_not_called()
+
+
+def test_check_packages_for_updates_concurrently():
+    """Several packages are checked and keyed by name, notifying in order."""
+    created = []
+
+    def make_checker(name):
+        checker = MagicMock(package_name=name)
+        checker.check_for_updates.return_value = {"package_name": name}
+        created.append(checker)
+        return checker
+
+    with patch("cac_core.updatechecker.UpdateChecker", side_effect=make_checker):
+        result = check_packages_for_updates(
+            ["pkg-a", "pkg-b", "pkg-a"], force=True, max_workers=0
+        )
+
+    assert result == {
+        "pkg-a": {"package_name": "pkg-a"},
+        "pkg-b": {"package_name": "pkg-b"},
+    }
+    for checker in created:
+        checker.check_for_updates.assert_called_once()
+        kwargs = checker.check_for_updates.call_args.kwargs
+        assert kwargs["force"] is True
+        # Workers never share the process-wide session.
+        assert isinstance(kwargs["session"], requests.Session)
+        assert kwargs["session"] is not uc._http_session()
+        checker.notify_if_update_available.assert_called_once_with(quiet=True)
+    assert check_packages_for_updates([]) == {}
+
+
+def test_import_does_not_load_http_stack():
+    """Importing the module defers requests/packaging/thread pools until used."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, cac_core.updatechecker; "
+        "print(any(m in sys.modules for m in "
+        "('requests', 'packaging.version', 'concurrent.futures')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
 
 
 # if __name__ == "__main__":